@@ -1,5 +1,18 @@
 """XML validators for MTS5 (RETTC) payload validation."""
 
-from app.validators.xml_basic import is_valid_xml
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.validators.xml_basic import is_valid_xml
 
 __all__ = ["is_valid_xml"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so importing a single validator module does not load
+    # app.config (and pydantic-settings) through xml_basic
+    if name == "is_valid_xml":
+        from app.validators.xml_basic import is_valid_xml
+
+        return is_valid_xml
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,7 +13,19 @@ Usage:
             print(f"Error: {error}")
 """
 
-from app.validators.mits.orchestrator import validate_mits_document
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["validate_mits_document"]
+if TYPE_CHECKING:
+    from app.validators.mits.orchestrator import validate_mits_document, validate_mits_file
 
+__all__ = ["validate_mits_document", "validate_mits_file"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so importing one section validator does not import the
+    # orchestrator and, through it, every other section validator
+    if name in __all__:
+        from app.validators.mits import orchestrator
+
+        return getattr(orchestrator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
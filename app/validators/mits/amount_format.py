@@ -166,6 +166,9 @@ class AmountFormatValidator(BaseValidator):
                 # Check fractional digits (up to 2 allowed)
                 # Get the exponent to determine decimal places
                 exponent = decimal_val.as_tuple().exponent
+                if not isinstance(exponent, int):
+                    # NaN and Infinity parse as Decimal but are not amounts
+                    raise InvalidOperation(val)
                 if exponent < -2:
                     self.result.add_error(
                         rule_id="amount_decimal_format",
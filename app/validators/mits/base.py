@@ -4,9 +4,10 @@ Base classes and models for MITS 5.0 validators.
 Provides common validation result structures and base validator classes.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 from xml.etree.ElementTree import Element
 
 from defusedxml import ElementTree as ET
@@ -20,9 +21,9 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationMessage:
-    """A single validation message."""
+    """A single validation message. Immutable once created."""
 
     rule_id: str  # e.g., "xml_wellformed", "fee_in_valid_parent"
     severity: ValidationSeverity
@@ -30,13 +31,17 @@ class ValidationMessage:
     element_path: Optional[str] = None  # XPath-like location
     details: Optional[dict] = None
 
+    def __post_init__(self) -> None:
+        """Intern the rule ID so set/dict lookups by rule compare by identity."""
+        object.__setattr__(self, "rule_id", sys.intern(self.rule_id))
+
     def __str__(self) -> str:
         """Format message for display."""
         location = f" at {self.element_path}" if self.element_path else ""
         return f"[{self.rule_id}] {self.message}{location}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation operation."""
 
@@ -44,6 +49,30 @@ class ValidationResult:
     errors: List[ValidationMessage] = field(default_factory=list)
     warnings: List[ValidationMessage] = field(default_factory=list)
     info: List[ValidationMessage] = field(default_factory=list)
+    # Index of errors by rule ID, kept alongside the ordered errors list
+    errors_by_rule: Dict[str, List[ValidationMessage]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Cache for error_rule_ids; reset whenever errors are added
+    _error_rule_ids: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Index any errors passed to the constructor."""
+        self._index_errors(self.errors)
+
+    def _index_errors(self, errors: Iterable[ValidationMessage]) -> None:
+        """Add errors to the by-rule index."""
+        for error in errors:
+            self.errors_by_rule.setdefault(error.rule_id, []).append(error)
+
+    @property
+    def error_rule_ids(self) -> FrozenSet[str]:
+        """Rule IDs of all errors, for O(1) membership checks. Built once per change."""
+        if self._error_rule_ids is None:
+            self._error_rule_ids = frozenset(self.errors_by_rule)
+        return self._error_rule_ids
 
     def add_error(
         self,
@@ -53,16 +82,17 @@ class ValidationResult:
         details: Optional[dict] = None,
     ) -> None:
         """Add an error message."""
-        self.errors.append(
-            ValidationMessage(
-                rule_id=rule_id,
-                severity=ValidationSeverity.ERROR,
-                message=message,
-                element_path=element_path,
-                details=details,
-            )
+        error = ValidationMessage(
+            rule_id=rule_id,
+            severity=ValidationSeverity.ERROR,
+            message=message,
+            element_path=element_path,
+            details=details,
         )
+        self.errors.append(error)
+        self.errors_by_rule.setdefault(error.rule_id, []).append(error)
         self.valid = False
+        self._error_rule_ids = None
 
     def add_warning(
         self,
@@ -102,7 +132,10 @@ class ValidationResult:
 
     def merge(self, other: "ValidationResult") -> None:
         """Merge another result into this one."""
-        self.errors.extend(other.errors)
+        if other.errors:
+            self.errors.extend(other.errors)
+            self._index_errors(other.errors)
+            self._error_rule_ids = None
         self.warnings.extend(other.warnings)
         self.info.extend(other.info)
         if not other.valid:
@@ -154,7 +187,7 @@ class BaseValidator:
             String representation of element's location
         """
         # Build path by traversing up the tree
-        path_parts = []
+        path_parts: List[str] = []
         current = element
 
         # Walk up to find position in tree
@@ -220,6 +220,8 @@ class CrossValidation(BaseValidator):
         Args:
             global_item_codes: Global registry of item codes
         """
+        circular_codes = self._find_circular_references(global_item_codes)
+
         for item_code, item_info in global_item_codes.items():
             percentage_of_code = item_info["percentage_of_code"]
             if not percentage_of_code:
@@ -243,7 +245,7 @@ class CrossValidation(BaseValidator):
                 continue
 
             # Rule O.92: Check for circular references
-            if self._has_circular_reference(item_code, global_item_codes, set()):
+            if item_code in circular_codes:
                 self.result.add_error(
                     rule_id="reference_no_circular",
                     message=f"Item '{item_code}' has circular percentage-of reference chain",
@@ -265,35 +267,49 @@ class CrossValidation(BaseValidator):
             # Rule O.94: Check for multiple amount blocks in target
             # (Overlap detection already handled in Section I)
 
-    def _has_circular_reference(
-        self, item_code: str, registry: Dict, visited: Set[str]
-    ) -> bool:
+    def _find_circular_references(self, registry: Dict) -> Set[str]:
         """
-        Check for circular percentage-of references.
+        Find every item whose percentage-of chain runs into a cycle.
+
+        Each item references at most one other item, so every chain is walked
+        once and its outcome memoized for all codes on it, keeping the check
+        linear in the number of items instead of re-walking per item.
 
         Args:
-            item_code: Item code to check
             registry: Global item registry
-            visited: Set of already visited codes
 
         Returns:
-            True if circular reference detected
+            Set of item codes whose reference chain is circular
         """
-        if item_code in visited:
-            return True
-
-        if item_code not in registry:
-            return False
-
-        visited.add(item_code)
-
-        percentage_of_code = registry[item_code]["percentage_of_code"]
-        if percentage_of_code:
-            if self._has_circular_reference(percentage_of_code, registry, visited):
-                return True
-
-        visited.remove(item_code)
-        return False
+        outcome: Dict[str, bool] = {}
+
+        for start in registry:
+            path: List[str] = []
+            on_path: Set[str] = set()
+            code = start
+
+            while True:
+                if code in outcome:
+                    circular = outcome[code]
+                    break
+                if code in on_path:
+                    circular = True
+                    break
+                if code not in registry:
+                    circular = False
+                    break
+
+                path.append(code)
+                on_path.add(code)
+                code = registry[code]["percentage_of_code"]
+                if not code:
+                    circular = False
+                    break
+
+            for visited in path:
+                outcome[visited] = circular
+
+        return {code for code, circular in outcome.items() if circular}
 
     def _validate_included_items(self) -> None:
         """
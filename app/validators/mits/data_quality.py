@@ -6,7 +6,7 @@ Validates text hygiene, date consistency, frequency/basis alignment, and duplica
 
 import re
 from datetime import datetime
-from typing import Dict, List, Set
+from typing import Any, Dict, List, Set
 
 from xml.etree.ElementTree import Element
 from defusedxml import ElementTree as ET
@@ -250,7 +250,7 @@ class DataQualityValidator(BaseValidator):
         Validate Rules T.109-110: Duplicates and collisions.
         """
         # Build a map of items by class for duplicate detection
-        class_items: Dict[str, List[tuple]] = {}
+        class_items: Dict[str, List[Dict[str, Any]]] = {}
 
         for class_elem in self.root.iter("ChargeOfferClass"):
             class_code = class_elem.get("Code", "unknown")
@@ -278,15 +278,15 @@ class DataQualityValidator(BaseValidator):
                 })
 
         # Check for duplicates within each class
-        for class_code, items in class_items.items():
+        for class_code, entries in class_items.items():
             # Rule T.109: Check for duplicate names (case-insensitive)
             name_counts: Dict[str, List[str]] = {}
-            for item in items:
-                name = item["name"]
+            for entry in entries:
+                name = entry["name"]
                 if name:
                     if name not in name_counts:
                         name_counts[name] = []
-                    name_counts[name].append(item["item_code"])
+                    name_counts[name].append(entry["item_code"])
 
             for name, codes in name_counts.items():
                 if len(codes) > 1:
@@ -300,11 +300,11 @@ class DataQualityValidator(BaseValidator):
 
             # Rule T.110: Check for exact duplicate items (same code + characteristics)
             hash_counts: Dict[str, List[str]] = {}
-            for item in items:
-                item_hash = item["hash"]
+            for entry in entries:
+                item_hash = entry["hash"]
                 if item_hash not in hash_counts:
                     hash_counts[item_hash] = []
-                hash_counts[item_hash].append(item["item_code"])
+                hash_counts[item_hash].append(entry["item_code"])
 
             for item_hash, codes in hash_counts.items():
                 if len(codes) > 1:
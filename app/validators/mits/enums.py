@@ -5,6 +5,7 @@ Contains all valid enumerated values referenced in the specification.
 """
 
 from enum import Enum
+from functools import cache
 
 
 class ChargeRequirement(Enum):
@@ -112,6 +113,12 @@ class ParkingSpaceType(Enum):
 # Helper functions for validation
 
 
+@cache
+def _enum_values(enum_class: type[Enum]) -> frozenset[str]:
+    """Allowed values of an enumeration, computed once per class."""
+    return frozenset(e.value for e in enum_class)
+
+
 def validate_enum(value: str, enum_class: type[Enum], rule_id: str, field_name: str) -> tuple[bool, str]:
     """
     Validate that a value matches one of the allowed enum values.
@@ -128,13 +135,12 @@ def validate_enum(value: str, enum_class: type[Enum], rule_id: str, field_name:
     if not value:
         return True, ""  # Empty is handled by required field checks
 
-    try:
-        enum_class(value)
+    if value in _enum_values(enum_class):
         return True, ""
-    except ValueError:
-        allowed = ", ".join([e.value for e in enum_class])
-        return (
-            False,
-            f"[{rule_id}] Invalid {field_name} value '{value}'. Allowed values: {allowed}",
-        )
+
+    allowed = ", ".join([e.value for e in enum_class])
+    return (
+        False,
+        f"[{rule_id}] Invalid {field_name} value '{value}'. Allowed values: {allowed}",
+    )
 
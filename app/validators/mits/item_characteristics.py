@@ -4,10 +4,10 @@ Section G: Item Characteristics — Presence & Enumerations (Rules 42-49)
 Validates the Characteristics block within offer items.
 """
 
-from typing import Set
+from decimal import Decimal
+from typing import List, Set, Tuple
 
 from xml.etree.ElementTree import Element
-from defusedxml import ElementTree as ET
 
 from app.validators.mits.base import BaseValidator, ValidationResult
 from app.validators.mits.enums import (
@@ -53,41 +53,54 @@ class ItemCharacteristicsValidator(BaseValidator):
         Returns:
             ValidationResult with any errors found
         """
-        # Collect all items for conditional reference validation (Rule 43)
-        all_items_codes = self._collect_all_item_codes()
+        # Single traversal: conditional references (Rule 43) may point at items
+        # that appear later in the document, so gather every item up front
+        items = self._collect_items()
+        all_items_codes = self._collect_all_item_codes(items)
 
-        for class_elem in self.root.iter("ChargeOfferClass"):
-            class_code = class_elem.get("Code", "unknown")
-            items = [child for child in class_elem if child.tag in self.VALID_ITEM_TYPES]
+        for class_code, item in items:
+            item_code = item.get("InternalCode", "unknown")
+            characteristics = item.find("Characteristics")
 
-            for item in items:
-                item_code = item.get("InternalCode", "unknown")
-                characteristics = item.find("Characteristics")
+            if characteristics is None:
+                continue  # Handled by Rule F.32
 
-                if characteristics is None:
-                    continue  # Handled by Rule F.32
-
-                char_path = f"{self.get_element_path(item)}/Characteristics"
-                self._validate_characteristics(
-                    characteristics, item_code, class_code, char_path, all_items_codes
-                )
+            char_path = f"{self.get_element_path(item)}/Characteristics"
+            self._validate_characteristics(
+                characteristics, item_code, class_code, char_path, all_items_codes
+            )
 
         return self.result
 
-    def _collect_all_item_codes(self) -> Set[str]:
+    def _collect_items(self) -> List[Tuple[str, Element]]:
+        """
+        Collect all offer items in document order.
+
+        Returns:
+            List of (class_code, item) pairs
+        """
+        return [
+            (class_elem.get("Code", "unknown"), child)
+            for class_elem in self.root.iter("ChargeOfferClass")
+            for child in class_elem
+            if child.tag in self.VALID_ITEM_TYPES
+        ]
+
+    def _collect_all_item_codes(self, items: List[Tuple[str, Element]]) -> Set[str]:
         """
-        Collect all InternalCode values from all items in the document.
+        Collect all InternalCode values from the document's items.
+
+        Args:
+            items: (class_code, item) pairs from _collect_items
 
         Returns:
             Set of all internal codes
         """
-        codes = set()
-        for class_elem in self.root.iter("ChargeOfferClass"):
-            items = [child for child in class_elem if child.tag in self.VALID_ITEM_TYPES]
-            for item in items:
-                code = item.get("InternalCode", "").strip()
-                if code:
-                    codes.add(code)
+        codes: Set[str] = set()
+        for _, item in items:
+            code = item.get("InternalCode", "").strip()
+            if code:
+                codes.add(code)
         return codes
 
     def _validate_characteristics(
@@ -375,8 +388,6 @@ class ItemCharacteristicsValidator(BaseValidator):
                     )
                 else:
                     try:
-                        from decimal import Decimal
-
                         val = Decimal(max_val)
                         if val < 0:
                             self.result.add_error(
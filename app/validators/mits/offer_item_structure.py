@@ -5,6 +5,7 @@ Validates the common structure of all offer items (ChargeOfferItem and specializ
 """
 
 from decimal import Decimal, InvalidOperation
+from typing import Dict, List, Optional
 
 from xml.etree.ElementTree import Element
 from defusedxml import ElementTree as ET
@@ -59,6 +60,28 @@ class OfferItemStructureValidator(BaseValidator):
         "PmsItemCategory",
     }
 
+    @staticmethod
+    def _index_children(item: Element) -> Dict[str, List[Element]]:
+        """
+        Group an item's direct children by tag in a single pass.
+
+        Args:
+            item: Offer item element
+
+        Returns:
+            Mapping of child tag to the child elements with that tag, in document order
+        """
+        children: Dict[str, List[Element]] = {}
+        for child in item:
+            children.setdefault(child.tag, []).append(child)
+        return children
+
+    @staticmethod
+    def _first_child(children: Dict[str, List[Element]], tag: str) -> Optional[Element]:
+        """Equivalent of item.find(tag) against an index from _index_children."""
+        found = children.get(tag)
+        return found[0] if found else None
+
     def validate(self) -> ValidationResult:
         """
         Execute Section F validation rules.
@@ -82,10 +105,13 @@ class OfferItemStructureValidator(BaseValidator):
         """
         items = [child for child in class_elem if child.tag in self.VALID_ITEM_TYPES]
         internal_codes = set()
+        class_path = self.get_element_path(class_elem)
 
         for item in items:
             item_code = item.get("InternalCode", "").strip()
-            item_path = f"{self.get_element_path(class_elem)}/{item.tag}"
+            item_path = f"{class_path}/{item.tag}"
+            # Indexed once and shared by every rule below
+            children = self._index_children(item)
 
             # Rule F.27: InternalCode is required and non-empty
             if not item_code:
@@ -93,20 +119,20 @@ class OfferItemStructureValidator(BaseValidator):
                 identifiers = []
                 
                 # Try Name first
-                name_elem = item.find("Name")
+                name_elem = self._first_child(children, "Name")
                 name = self.get_text(name_elem) if name_elem is not None else None
                 if name:
                     identifiers.append(f"Name='{name}'")
                 
                 # Try Description
-                desc_elem = item.find("Description")
+                desc_elem = self._first_child(children, "Description")
                 desc = self.get_text(desc_elem) if desc_elem is not None else None
                 if desc and not name:  # Only use if no name
                     identifiers.append(f"Description='{desc[:50]}...'")  # Truncate long descriptions
                 
                 # Try ChargeRequirement as last resort
                 if not identifiers:
-                    req_elem = item.find("ChargeRequirement")
+                    req_elem = self._first_child(children, "ChargeRequirement")
                     req = self.get_text(req_elem) if req_elem is not None else None
                     if req:
                         identifiers.append(f"ChargeRequirement='{req}'")
@@ -148,22 +174,22 @@ class OfferItemStructureValidator(BaseValidator):
                 internal_codes.add(item_code)
 
             # Validate required and optional fields
-            self._validate_item_structure(item, item_code, class_code, item_path)
+            self._validate_item_structure(children, item_code, class_code, item_path)
 
     def _validate_item_structure(
-        self, item: Element, item_code: str, class_code: str, item_path: str
+        self, children: Dict[str, List[Element]], item_code: str, class_code: str, item_path: str
     ) -> None:
         """
         Validate the structure of a single offer item.
 
         Args:
-            item: Offer item element
+            children: Direct children of the item grouped by tag
             item_code: InternalCode of the item
             class_code: Code of the parent class
             item_path: Path to item for error messages
         """
         # Rule F.30: Required <Name> element
-        name_elem = item.find("Name")
+        name_elem = self._first_child(children, "Name")
         if name_elem is None:
             self.result.add_error(
                 rule_id="item_has_name",
@@ -180,7 +206,7 @@ class OfferItemStructureValidator(BaseValidator):
             )
 
         # Rule F.31: Required <Description> element
-        desc_elem = item.find("Description")
+        desc_elem = self._first_child(children, "Description")
         if desc_elem is None:
             self.result.add_error(
                 rule_id="item_has_description",
@@ -197,7 +223,7 @@ class OfferItemStructureValidator(BaseValidator):
             )
 
         # Rule F.32: Exactly one <Characteristics> block
-        characteristics = item.findall("Characteristics")
+        characteristics = children.get("Characteristics", [])
         if len(characteristics) == 0:
             self.result.add_error(
                 rule_id="item_has_one_characteristics",
@@ -215,7 +241,7 @@ class OfferItemStructureValidator(BaseValidator):
             )
 
         # Rule F.33: Item contains ≥1 ChargeOfferAmount
-        amounts = item.findall("ChargeOfferAmount")
+        amounts = children.get("ChargeOfferAmount")
         if not amounts:
             self.result.add_error(
                 rule_id="item_has_amount_blocks",
@@ -226,25 +252,25 @@ class OfferItemStructureValidator(BaseValidator):
             )
         
         # Rule F.37: AmountBasis required unless ChargeRequirement="Included"
-        self._validate_amount_basis_required(item, item_code, class_code, item_path)
+        self._validate_amount_basis_required(children, item_code, class_code, item_path)
 
         # Rules F.34, F.35, F.36: Validate occurrence constraints
-        self._validate_occurrences(item, item_code, class_code, item_path)
+        self._validate_occurrences(children, item_code, class_code, item_path)
 
     def _validate_amount_basis_required(
-        self, item: Element, item_code: str, class_code: str, item_path: str
+        self, children: Dict[str, List[Element]], item_code: str, class_code: str, item_path: str
     ) -> None:
         """
         Validate Rule F.37: AmountBasis required unless ChargeRequirement="Included".
 
         Args:
-            item: Offer item element
+            children: Direct children of the item grouped by tag
             item_code: InternalCode of the item
             class_code: Code of the parent class
             item_path: Path to item for error messages
         """
         # Get ChargeRequirement from Characteristics
-        characteristics = item.find("Characteristics")
+        characteristics = self._first_child(children, "Characteristics")
         if characteristics is None:
             return  # Already validated by rule F.32
         
@@ -256,7 +282,7 @@ class OfferItemStructureValidator(BaseValidator):
         
         # Only check if ChargeRequirement is Mandatory or Optional
         if charge_req in ("Mandatory", "Optional", "Conditional"):
-            amount_basis_elem = item.find("AmountBasis")
+            amount_basis_elem = self._first_child(children, "AmountBasis")
             if amount_basis_elem is None or not self.get_text(amount_basis_elem):
                 self.result.add_error(
                     rule_id="item_amount_basis_required",
@@ -267,19 +293,19 @@ class OfferItemStructureValidator(BaseValidator):
                 )
 
     def _validate_occurrences(
-        self, item: Element, item_code: str, class_code: str, item_path: str
+        self, children: Dict[str, List[Element]], item_code: str, class_code: str, item_path: str
     ) -> None:
         """
         Validate ItemMinimumOccurrences and ItemMaximumOccurrences.
 
         Args:
-            item: Offer item element
+            children: Direct children of the item grouped by tag
             item_code: InternalCode of the item
             class_code: Code of the parent class
             item_path: Path to item for error messages
         """
-        min_occur_elem = item.find("ItemMinimumOccurrences")
-        max_occur_elem = item.find("ItemMaximumOccurrences")
+        min_occur_elem = self._first_child(children, "ItemMinimumOccurrences")
+        max_occur_elem = self._first_child(children, "ItemMaximumOccurrences")
 
         min_occur = None
         max_occur = None
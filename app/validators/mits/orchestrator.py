@@ -5,12 +5,20 @@ Coordinates all section validators and returns comprehensive validation results.
 """
 
 import logging
-from typing import Dict, List
+from os import PathLike
+from typing import BinaryIO, Dict, List, Optional, Union
 
+from xml.etree.ElementTree import Element
+from defusedxml import DefusedXmlException
 from defusedxml import ElementTree as ET
 
 from app.validators.mits.base import ValidationResult
-from app.validators.mits.xml_structure import XmlStructureValidator, validate_xml_wellformed
+from app.validators.mits.xml_structure import (
+    PARSER_OPTIONS,
+    XmlStructureValidator,
+    parse_failure,
+    parse_wellformed,
+)
 from app.validators.mits.fee_hierarchy import FeeHierarchyValidator
 from app.validators.mits.identity_uniqueness import IdentityUniquenessValidator
 from app.validators.mits.charge_class import ChargeClassValidator
@@ -29,7 +37,7 @@ from app.validators.mits.data_quality import DataQualityValidator
 logger = logging.getLogger(__name__)
 
 
-def validate_mits_document(xml_text: str) -> Dict[str, List[str] | bool]:
+def validate_mits_document(xml_text: Union[str, bytes]) -> Dict[str, List[str] | bool]:
     """
     Validate a MITS 5.0 XML document against all specification rules.
 
@@ -47,7 +55,7 @@ def validate_mits_document(xml_text: str) -> Dict[str, List[str] | bool]:
         Phase 7: Data quality, hygiene, dates, and duplicates
 
     Args:
-        xml_text: Raw XML text to validate
+        xml_text: Raw XML text to validate, or its UTF-8 encoded bytes
 
     Returns:
         Dictionary with validation results:
@@ -62,24 +70,101 @@ def validate_mits_document(xml_text: str) -> Dict[str, List[str] | bool]:
     result = ValidationResult(valid=True)
 
     # Phase 1: XML Well-formedness (Rules A.1-2)
-    # Must succeed before we can parse the document
-    wellformed_result = validate_xml_wellformed(xml_text)
+    # The well-formedness parse also yields the tree validated below
+    root, wellformed_result = parse_wellformed(xml_text)
     result.merge(wellformed_result)
 
-    if not wellformed_result.valid:
+    if root is None:
         logger.warning("XML well-formedness validation failed, stopping")
         return result.to_dict()
 
-    # Parse the document
+    return _validate_root(root, result)
+
+
+def validate_mits_file(source: Union[str, "PathLike[str]", BinaryIO]) -> Dict[str, List[str] | bool]:
+    """
+    Validate a MITS 5.0 XML file without first reading it into a string.
+
+    The parser is fed from the file in chunks, so peak memory is the parsed
+    tree rather than the raw text, its UTF-8 encoding and the tree together.
+    Sections A-T still need the whole tree (uniqueness and cross-references
+    span Properties), so the document is not validated Property by Property.
+
+    Args:
+        source: Path to the XML file, or a binary file object
+
+    Returns:
+        Dictionary with validation results, as for validate_mits_document
+    """
+    logger.info("Starting MITS 5.0 file validation")
+    result = ValidationResult(valid=True)
+
+    # Phase 1: XML Well-formedness (Rules A.1-2), checked by parsing the stream
+    root = None
+    # Where a file object's document starts, in case it has to be read again
+    start = _start_position(source)
     try:
-        root = ET.fromstring(xml_text.encode("utf-8"))
-    except Exception as e:
-        result.add_error(
-            rule_id="xml_wellformed",
-            message=f"Failed to parse XML: {str(e)}",
-        )
+        root = ET.parse(source, **PARSER_OPTIONS).getroot()
+    except (ET.ParseError, DefusedXmlException) as e:
+        # The raw bytes are only needed to tell an encoding error apart
+        xml_bytes = _read_back(source, start) if isinstance(e, ET.ParseError) else None
+        result.merge(parse_failure(e, xml_bytes))
+
+    if root is None:
+        logger.warning("XML well-formedness validation failed, stopping")
         return result.to_dict()
 
+    return _validate_root(root, result)
+
+
+def _start_position(source: Union[str, "PathLike[str]", BinaryIO]) -> Optional[int]:
+    """
+    Record where a file object's document starts.
+
+    Args:
+        source: Path to the XML file, or a binary file object
+
+    Returns:
+        The stream position, or None for paths and streams that cannot seek
+    """
+    if isinstance(source, (str, PathLike)) or not source.seekable():
+        return None
+    return source.tell()
+
+
+def _read_back(
+    source: Union[str, "PathLike[str]", BinaryIO], start: Optional[int]
+) -> Optional[bytes]:
+    """
+    Read a file source again after a failed parse.
+
+    Args:
+        source: Path to the XML file, or a binary file object
+        start: Position the document started at in a file object
+
+    Returns:
+        The document's bytes, or None if a file object cannot be rewound
+    """
+    if isinstance(source, (str, PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if start is None:
+        return None
+    source.seek(start)
+    return source.read()
+
+
+def _validate_root(root: Element, result: ValidationResult) -> Dict[str, List[str] | bool]:
+    """
+    Run Phases 2-7 against an already parsed document.
+
+    Args:
+        root: Root element of the parsed document
+        result: Result accumulated so far (Phase 1)
+
+    Returns:
+        Dictionary with validation results
+    """
     # Phase 2: Sections A-C - Container, placement, identity (short-circuit on failure)
     logger.info("Validating Sections A-C: Container & Identity")
 
@@ -6,13 +6,41 @@ These are critical checks that must pass before proceeding with detailed validat
 """
 
 import re
-from typing import Set
+from collections import Counter
+from typing import List, Optional, Tuple, TypedDict, Union
 
+from xml.etree.ElementTree import Element
 from defusedxml import ElementTree as ET
 
 from app.validators.mits.base import BaseValidator, ValidationResult
 
 
+class ParserOptions(TypedDict):
+    """Keyword options accepted by the defusedxml parse functions."""
+
+    forbid_dtd: bool
+    forbid_entities: bool
+    forbid_external: bool
+
+
+# Options for every MITS parse: defusedxml's defaults, spelled out so both
+# entry points share them. A DOCTYPE is well-formed XML and is accepted;
+# entity declarations and external references are rejected.
+PARSER_OPTIONS: ParserOptions = {
+    "forbid_dtd": False,
+    "forbid_entities": True,
+    "forbid_external": True,
+}
+
+# Encoding named in the XML declaration, matched against the raw bytes
+_ENCODING_DECLARATION = re.compile(
+    rb"(?:\xef\xbb\xbf)?<\?xml[^>]*?\bencoding\s*=\s*[\"']([A-Za-z0-9._-]+)[\"']"
+)
+
+# The declaration must open the document, so only its first bytes are scanned
+_DECLARATION_SCAN_BYTES = 256
+
+
 class XmlStructureValidator(BaseValidator):
     """
     Validator for XML Structure.
@@ -45,85 +73,175 @@ class XmlStructureValidator(BaseValidator):
             )
             return self.result
 
-        # Rule: property_exists
-        properties = self.root.findall("Property")
-        if not properties:
-            self.result.add_error(
-                rule_id="property_exists",
-                message="<PhysicalProperty> must contain at least one <Property> element",
-                element_path="/PhysicalProperty",
-            )
-            return self.result
+        # Rules: property_exists & property_has_id, in one pass that collects the IDs
+        property_ids: List[str] = []
+        count = 0
 
-        # Rules: property_has_id & property_id_unique
-        property_ids: Set[str] = set()
+        # Properties are direct children of the root, so they are matched by tag
+        # rather than through ElementPath, which looks up its compiled-path cache
+        # on every call
+        properties = (child for child in self.root if child.tag == "Property")
 
-        for idx, prop in enumerate(properties, start=1):
-            id_value = prop.get("IDValue", "").strip()
+        for count, prop in enumerate(properties, start=1):
+            # strip() hands back the same string when there is nothing to trim,
+            # so well-formed IDs are not copied; missing and blank IDs become None
+            id_value = prop.get("IDValue", "").strip() or None
 
             # Rule: property_has_id
-            if not id_value:
+            if id_value is None:
                 self.result.add_error(
                     rule_id="property_has_id",
-                    message=f"<Property> element #{idx} missing or has empty @IDValue attribute",
-                    element_path=f"/PhysicalProperty/Property[{idx}]",
+                    message=f"<Property> element #{count} missing or has empty @IDValue attribute",
+                    element_path=f"/PhysicalProperty/Property[{count}]",
                 )
                 continue
 
-            # Rule: property_id_unique
-            if id_value in property_ids:
+            property_ids.append(id_value)
+
+        # Rule: property_id_unique - one error per duplicated ID, in document order
+        for id_value, occurrences in Counter(property_ids).items():
+            if occurrences > 1:
                 self.result.add_error(
                     rule_id="property_id_unique",
-                    message=f"Duplicate Property @IDValue '{id_value}' found. "
+                    message=f"Duplicate Property @IDValue '{id_value}' found {occurrences} times. "
                     f"Property IDs must be unique across all <Property> elements",
                     element_path=f"/PhysicalProperty/Property[@IDValue='{id_value}']",
-                    details={"duplicate_id": id_value},
+                    details={"duplicate_id": id_value, "occurrences": occurrences},
                 )
-            else:
-                property_ids.add(id_value)
+
+        # Rule: property_exists
+        if count == 0:
+            self.result.add_error(
+                rule_id="property_exists",
+                message="<PhysicalProperty> must contain at least one <Property> element",
+                element_path="/PhysicalProperty",
+            )
 
         return self.result
 
 
-def validate_xml_wellformed(xml_text: str) -> ValidationResult:
+def parse_wellformed(xml_text: Union[str, bytes]) -> Tuple[Optional[Element], ValidationResult]:
     """
-    Validate XML well-formedness and encoding.
+    Validate XML well-formedness and encoding, keeping the parsed document.
 
-    This function is called before creating the validator instance since
-    it needs to handle parsing errors.
+    The trial parse that proves well-formedness is the real parse, so callers
+    that go on to validate the document do not parse it a second time.
 
     Args:
-        xml_text: Raw XML text to validate
+        xml_text: Raw XML text to validate, or its UTF-8 encoded bytes
 
     Returns:
-        ValidationResult with any parsing errors
+        Tuple of (root element, or None if parsing failed; ValidationResult
+        with any encoding or parsing errors)
     """
     result = ValidationResult(valid=True)
+    root = None
 
     # Rule: xml_encoding_utf8
-    try:
-        # Try to encode/decode as UTF-8
-        xml_text.encode("utf-8")
-    except UnicodeEncodeError as e:
-        result.add_error(
-            rule_id="xml_encoding_utf8",
-            message=f"XML encoding error: {str(e)}. Document must be valid UTF-8",
-        )
-        return result
+    if isinstance(xml_text, bytes):
+        # Already encoded; invalid UTF-8 is diagnosed below if the parse fails
+        xml_bytes = xml_text
+    else:
+        try:
+            xml_bytes = xml_text.encode("utf-8")
+        except UnicodeEncodeError as e:
+            result.add_error(
+                rule_id="xml_encoding_utf8",
+                message=f"XML encoding error: {str(e)}. Document must be valid UTF-8",
+            )
+            return root, result
 
     # Rule: xml_wellformed
     try:
-        ET.fromstring(xml_text.encode("utf-8"))
-    except ET.ParseError as e:
+        root = ET.fromstring(xml_bytes, **PARSER_OPTIONS)
+    except Exception as e:
+        result.merge(parse_failure(e, xml_bytes))
+
+    return root, result
+
+
+def parse_failure(error: Exception, xml_bytes: Optional[bytes] = None) -> ValidationResult:
+    """
+    Map a failed parse to its Phase 1 rule.
+
+    Shared by every entry point, so the same input is classified the same way
+    whether it arrives as text, bytes or a file.
+
+    Args:
+        error: Exception raised by the parser
+        xml_bytes: Raw document bytes, if available, for encoding diagnosis
+
+    Returns:
+        ValidationResult with the xml_encoding_utf8 or xml_wellformed error
+    """
+    result = ValidationResult(valid=True)
+
+    if not isinstance(error, ET.ParseError):
+        # e.g. defusedxml rejecting entity declarations or external references
         result.add_error(
             rule_id="xml_wellformed",
-            message=f"XML is not well-formed: {str(e)}",
+            message=f"Failed to parse XML: {str(error)}",
         )
-    except Exception as e:
+    elif xml_bytes is not None and _declares_utf8(xml_bytes) and not _is_utf8(xml_bytes):
+        # Rule: xml_encoding_utf8 - only checked once the parser has failed
+        result.add_error(
+            rule_id="xml_encoding_utf8",
+            message=f"XML encoding error: {str(error)}. Document must be valid UTF-8",
+        )
+    else:
         result.add_error(
             rule_id="xml_wellformed",
-            message=f"Failed to parse XML: {str(e)}",
+            message=f"XML is not well-formed: {str(error)}",
         )
 
     return result
 
+
+def _declares_utf8(xml_bytes: bytes) -> bool:
+    """
+    Check whether a document is declared as UTF-8.
+
+    A document without an encoding declaration is UTF-8 by default. Only the
+    leading bytes are scanned, without decoding the document.
+
+    Args:
+        xml_bytes: Raw XML bytes
+
+    Returns:
+        True if the document is (implicitly or explicitly) UTF-8
+    """
+    match = _ENCODING_DECLARATION.match(xml_bytes, 0, _DECLARATION_SCAN_BYTES)
+    return match is None or match.group(1).upper() in (b"UTF-8", b"UTF8")
+
+
+def _is_utf8(xml_bytes: bytes) -> bool:
+    """
+    Check whether raw bytes are valid UTF-8.
+
+    Args:
+        xml_bytes: Raw XML bytes
+
+    Returns:
+        True if the bytes decode as UTF-8
+    """
+    try:
+        xml_bytes.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def validate_xml_wellformed(xml_text: Union[str, bytes]) -> ValidationResult:
+    """
+    Validate XML well-formedness and encoding.
+
+    This function is called before creating the validator instance since
+    it needs to handle parsing errors.
+
+    Args:
+        xml_text: Raw XML text to validate, or its UTF-8 encoded bytes
+
+    Returns:
+        ValidationResult with any parsing errors
+    """
+    return parse_wellformed(xml_text)[1]
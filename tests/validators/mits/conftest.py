@@ -2,12 +2,58 @@
 Shared fixtures for MITS validator tests.
 """
 
+# Test documents are trusted literals, so parse them with the stdlib C parser
+# directly; the defusedxml wrapper roughly doubles per-parse cost. The
+# validators under test still parse untrusted input through defusedxml.
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Mapping
+from functools import cache, lru_cache
+from string import Template
+from types import MappingProxyType
+from typing import Any
+from xml.etree.ElementTree import Element
+
 import pytest
-from xml.etree.ElementTree import Element, SubElement
-from defusedxml import ElementTree as ET
 
+from app.validators.mits import validate_mits_document
 
-@pytest.fixture
+# Baseline document whose single item matches the create_charge_item defaults
+MINIMAL_XML = """<PhysicalProperty>
+    <Property IDValue="1">
+        <ChargeOfferClass Code="APP">
+            <ChargeOfferItem InternalCode="item1">
+                <Name>Test Item</Name>
+                <Description>Test Description</Description>
+                <Characteristics>
+                    <ChargeRequirement>Mandatory</ChargeRequirement>
+                    <Lifecycle>At Application</Lifecycle>
+                    <PaymentFrequency>One-time</PaymentFrequency>
+                </Characteristics>
+                <AmountBasis>Explicit</AmountBasis>
+                <ChargeOfferAmount>
+                    <Amounts>50.00</Amounts>
+                    <Percentage></Percentage>
+                </ChargeOfferAmount>
+            </ChargeOfferItem>
+        </ChargeOfferClass>
+    </Property>
+</PhysicalProperty>"""
+MINIMAL_XML_BYTES = MINIMAL_XML.encode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def minimal_valid_root() -> Element:
+    """
+    Baseline document parsed once per session. Treat as read-only.
+
+    Under pytest-xdist every worker is its own session, so each worker
+    parses the bytes itself and no Element crosses a process boundary.
+    """
+    return ET.fromstring(MINIMAL_XML_BYTES)
+
+
+@pytest.fixture(scope="module")
 def minimal_valid_property():
     """Create a minimal valid Property element."""
     return """<Property IDValue="prop-1">
@@ -30,17 +76,95 @@ def minimal_valid_property():
 </Property>"""
 
 
-@pytest.fixture
+# ET.fromstring accepts str (fed to expat as UTF-8, whatever the declaration
+# says) and bytes directly, so the cache wraps it without a shim: a cache hit
+# runs no Python frame. A miss still runs fromstring, which builds a new
+# XMLParser.
+_parse = lru_cache(maxsize=512)(ET.fromstring)
+
+
+@pytest.fixture(scope="session")
 def parse_xml():
-    """Helper function to parse XML strings."""
-    def _parse(xml_string: str) -> Element:
-        if not xml_string.strip().startswith("<?xml"):
-            xml_string = f'<?xml version="1.0" encoding="UTF-8"?>\n{xml_string}'
-        return ET.fromstring(xml_string.encode("utf-8"))
+    """
+    Helper function to parse XML strings.
+
+    Parsed trees are cached per source and shared between tests. The
+    validators never modify the tree; tests that need to mutate one should
+    copy.deepcopy it first (as root_factory in test_offer_item_structure does).
+    """
     return _parse
 
 
+def pytest_collection_modifyitems(items):
+    """
+    Parse every indirect xml_root literal during collection.
+
+    Test bodies then only validate; the parsed trees are already in the
+    session cache that parse_xml and xml_root read from.
+    """
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "xml_root" in callspec.params:
+            _parse(callspec.params["xml_root"])
+
+
 @pytest.fixture
+def xml_root(request, parse_xml) -> Element:
+    """
+    Parsed root for indirect parametrization.
+
+    Use with @pytest.mark.parametrize("xml_root", [...], indirect=True); each
+    XML literal is parsed once per session and shared via parse_xml.
+    """
+    return parse_xml(request.param)
+
+
+# Single-property document wrapper, compiled once at import
+_DOCUMENT = Template('<PhysicalProperty><Property IDValue="1">$body</Property></PhysicalProperty>')
+
+
+@pytest.fixture(scope="module")
+def create_document():
+    """Helper to wrap content in a PhysicalProperty with one Property, as UTF-8 bytes."""
+    def _create(body: str) -> bytes:
+        return _DOCUMENT.substitute(body=body).encode("utf-8")
+    return _create
+
+
+# Orchestrator errors are formatted "[rule_id] message"
+_RULE_ID = re.compile(r"\[([^\]]+)\]")
+
+
+@cache
+def _cached_validate(xml_bytes: bytes) -> Mapping[str, Any]:
+    # validate_mits_document is pure for a given input, so byte-identical
+    # documents share one read-only result (lists frozen to tuples). The
+    # fired rule IDs are extracted once, for set-membership assertions.
+    result = validate_mits_document(xml_bytes)
+    frozen = {
+        key: tuple(value) if isinstance(value, list) else value for key, value in result.items()
+    }
+    frozen["rule_ids"] = frozenset(
+        match.group(1) for match in map(_RULE_ID.match, result["errors"]) if match
+    )
+    return MappingProxyType(frozen)
+
+
+@pytest.fixture(scope="session")
+def validate_document():
+    """
+    Helper to run the orchestrator, memoized per unique document.
+
+    The returned mapping also carries "rule_ids", the set of rules that fired.
+    """
+    def _validate(xml: str | bytes) -> Mapping[str, Any]:
+        if isinstance(xml, str):
+            xml = xml.encode("utf-8")
+        return _cached_validate(xml)
+    return _validate
+
+
+@pytest.fixture(scope="module")
 def create_physical_property():
     """Helper to create PhysicalProperty wrapper."""
     def _create(content: str) -> str:
@@ -51,7 +175,7 @@ def create_physical_property():
     return _create
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def create_property():
     """Helper to create Property element."""
     def _create(id_value: str = "1", content: str = "") -> str:
@@ -59,15 +183,55 @@ def create_property():
     return _create
 
 
-@pytest.fixture
+# The builders below are memoized: tests call them with a small set of
+# argument combinations and the returned strings are immutable. Fixtures
+# fill in defaults and pass every argument positionally, so equivalent
+# calls share one cache key.
+
+
+@cache
+def _charge_class(code: str, content: str) -> str:
+    return f'<ChargeOfferClass Code="{code}">{content}</ChargeOfferClass>'
+
+
+@cache
+def _charge_item(
+    internal_code: str,
+    name: str,
+    description: str,
+    requirement: str,
+    lifecycle: str,
+    amount_basis: str,
+    amounts: str,
+    frequency: str,
+    extra_content: str,
+) -> str:
+    return f"""<ChargeOfferItem InternalCode="{internal_code}">
+    <Name>{name}</Name>
+    <Description>{description}</Description>
+    <Characteristics>
+        <ChargeRequirement>{requirement}</ChargeRequirement>
+        <Lifecycle>{lifecycle}</Lifecycle>
+        <PaymentFrequency>{frequency}</PaymentFrequency>
+    </Characteristics>
+    <AmountBasis>{amount_basis}</AmountBasis>
+    <ChargeOfferAmount>
+        <Amounts>{amounts}</Amounts>
+        <Percentage></Percentage>
+    </ChargeOfferAmount>
+    {extra_content}
+</ChargeOfferItem>"""
+
+
+@pytest.fixture(scope="module")
 def create_charge_class():
     """Helper to create ChargeOfferClass element."""
     def _create(code: str = "APP", content: str = "") -> str:
-        return f'<ChargeOfferClass Code="{code}">{content}</ChargeOfferClass>'
+        return _charge_class(code, content)
     return _create
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def create_charge_item():
     """Helper to create ChargeOfferItem element."""
     def _create(
@@ -81,25 +245,21 @@ def create_charge_item():
         frequency: str = "One-time",
         extra_content: str = "",
     ) -> str:
-        return f"""<ChargeOfferItem InternalCode="{internal_code}">
-    <Name>{name}</Name>
-    <Description>{description}</Description>
-    <Characteristics>
-        <ChargeRequirement>{requirement}</ChargeRequirement>
-        <Lifecycle>{lifecycle}</Lifecycle>
-        <PaymentFrequency>{frequency}</PaymentFrequency>
-    </Characteristics>
-    <AmountBasis>{amount_basis}</AmountBasis>
-    <ChargeOfferAmount>
-        <Amounts>{amounts}</Amounts>
-        <Percentage></Percentage>
-    </ChargeOfferAmount>
-    {extra_content}
-</ChargeOfferItem>"""
+        return _charge_item(
+            internal_code,
+            name,
+            description,
+            requirement,
+            lifecycle,
+            amount_basis,
+            amounts,
+            frequency,
+            extra_content,
+        )
     return _create
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def create_pet_item():
     """Helper to create PetOfferItem element."""
     def _create(
@@ -127,7 +287,7 @@ def create_pet_item():
     return _create
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def create_parking_item():
     """Helper to create ParkingOfferItem element."""
     def _create(
@@ -154,7 +314,7 @@ def create_parking_item():
     return _create
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def create_storage_item():
     """Helper to create StorageOfferItem element."""
     def _create(
@@ -181,7 +341,7 @@ def create_storage_item():
     return _create
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def assert_has_error():
     """Helper to assert a result contains a specific error rule."""
     def _assert(result: dict, rule_id: str, message_contains: str = None):
@@ -198,7 +358,16 @@ def assert_has_error():
     return _assert
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def assert_rule_fired():
+    """Helper to assert a ValidationResult contains an error for an exact rule_id."""
+    def _assert(result, rule_id: str) -> None:
+        fired = result.error_rule_ids
+        assert rule_id in fired, f"Expected error with rule_id '{rule_id}', but fired: {sorted(fired)}"
+    return _assert
+
+
+@pytest.fixture(scope="module")
 def assert_no_errors():
     """Helper to assert a result has no errors."""
     def _assert(result: dict):
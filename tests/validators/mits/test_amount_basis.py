@@ -19,20 +19,16 @@ from app.validators.mits.amount_basis import AmountBasisValidator
 class TestBasisEnumValid:
     """Test basis_enum_valid rule."""
 
-    def test_explicit_basis(self, parse_xml, create_charge_class, create_charge_item):
+    def test_explicit_basis(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """AmountBasis = 'Explicit' - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(amount_basis="Explicit"))}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item(amount_basis="Explicit")))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_percentage_of_basis(self, parse_xml, create_charge_class):
+    def test_percentage_of_basis(self, parse_xml, create_charge_class, create_document):
         """AmountBasis = 'Percentage Of' - should pass."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -48,49 +44,37 @@ class TestBasisEnumValid:
                 <PercentageOfCode>base_rent</PercentageOfCode>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         # Should accept valid enum value
 
-    def test_invalid_basis_value(self, parse_xml, create_charge_class, create_charge_item):
+    def test_invalid_basis_value(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """AmountBasis with invalid value - should fail."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(amount_basis="InvalidValue"))}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item(amount_basis="InvalidValue")))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_enum_valid" in e.rule_id for e in result.errors)
+        assert "basis_enum_valid" in result.error_rule_ids
 
 
 class TestBasisExplicit:
     """Test basis_explicit_* rules."""
 
-    def test_explicit_with_amounts(self, parse_xml, create_charge_class, create_charge_item):
+    def test_explicit_with_amounts(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """Explicit basis with Amounts populated - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(amount_basis="Explicit", amounts="50.00"))}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item(amount_basis="Explicit", amounts="50.00")))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_explicit_without_amounts(self, parse_xml, create_charge_class):
+    def test_explicit_without_amounts(self, parse_xml, create_charge_class, create_document):
         """Explicit basis without Amounts - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -105,19 +89,15 @@ class TestBasisExplicit:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_explicit" in e.rule_id for e in result.errors)
+        assert "basis_explicit_amounts_nonempty" in result.error_rule_ids
 
-    def test_explicit_with_percentage_populated(self, parse_xml, create_charge_class):
+    def test_explicit_with_percentage_populated(self, parse_xml, create_charge_class, create_document):
         """Explicit basis with Percentage populated - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -132,23 +112,19 @@ class TestBasisExplicit:
                 <Percentage>10.00</Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_explicit_percentage_empty" in e.rule_id for e in result.errors)
+        assert "basis_explicit_percentage_empty" in result.error_rule_ids
 
 
 class TestBasisPercentageOf:
     """Test basis_percentage_* rules."""
 
-    def test_percentage_of_valid_structure(self, parse_xml, create_charge_class):
+    def test_percentage_of_valid_structure(self, parse_xml, create_charge_class, create_document):
         """Percentage Of with valid structure - should pass."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Pet Fee</Name>
@@ -165,18 +141,14 @@ class TestBasisPercentageOf:
                 <PercentageOfCode>base_rent</PercentageOfCode>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("PET", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("PET", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         # Should pass with correct structure
 
-    def test_percentage_of_without_percentage_value(self, parse_xml, create_charge_class):
+    def test_percentage_of_without_percentage_value(self, parse_xml, create_charge_class, create_document):
         """Percentage Of without Percentage value - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -192,19 +164,15 @@ class TestBasisPercentageOf:
                 <PercentageOfCode>base_rent</PercentageOfCode>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_percentage_has_value" in e.rule_id for e in result.errors)
+        assert "basis_percentage_has_value" in result.error_rule_ids
 
-    def test_percentage_of_with_amounts_populated(self, parse_xml, create_charge_class):
+    def test_percentage_of_with_amounts_populated(self, parse_xml, create_charge_class, create_document):
         """Percentage Of with Amounts populated - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -220,19 +188,15 @@ class TestBasisPercentageOf:
                 <PercentageOfCode>base_rent</PercentageOfCode>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_percentage_amounts_empty" in e.rule_id for e in result.errors)
+        assert "basis_percentage_amounts_empty" in result.error_rule_ids
 
-    def test_percentage_of_without_code(self, parse_xml, create_charge_class):
+    def test_percentage_of_without_code(self, parse_xml, create_charge_class, create_document):
         """Percentage Of without PercentageOfCode - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -247,19 +211,15 @@ class TestBasisPercentageOf:
                 <Percentage>10.00</Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_percentage_has_code" in e.rule_id for e in result.errors)
+        assert "basis_percentage_has_code" in result.error_rule_ids
 
-    def test_percentage_of_self_reference(self, parse_xml, create_charge_class):
+    def test_percentage_of_self_reference(self, parse_xml, create_charge_class, create_document):
         """Percentage Of referencing itself - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -275,23 +235,19 @@ class TestBasisPercentageOf:
                 <PercentageOfCode>fee1</PercentageOfCode>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_percentage_no_circular" in e.rule_id for e in result.errors)
+        assert "basis_percentage_no_circular" in result.error_rule_ids
 
 
 class TestBasisRange:
     """Test basis_range_* rules (Range or Variable)."""
 
-    def test_range_with_two_separate_amounts(self, parse_xml, create_charge_class):
+    def test_range_with_two_separate_amounts(self, parse_xml, create_charge_class, create_document):
         """Range basis with exactly two separate Amounts elements - should pass."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -307,18 +263,14 @@ class TestBasisRange:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is True, "Within Range with exactly 2 separate Amounts elements should pass"
 
-    def test_range_with_two_separate_amounts_range_or_variable(self, parse_xml, create_charge_class):
+    def test_range_with_two_separate_amounts_range_or_variable(self, parse_xml, create_charge_class, create_document):
         """Range or Variable basis with exactly two separate Amounts elements - should pass."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -334,18 +286,14 @@ class TestBasisRange:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is True, "Range or Variable with exactly 2 separate Amounts elements should pass"
 
-    def test_range_with_single_amount_element(self, parse_xml, create_charge_class):
+    def test_range_with_single_amount_element(self, parse_xml, create_charge_class, create_document):
         """Range basis with only one Amounts element - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -360,19 +308,15 @@ class TestBasisRange:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_range_one_amount" in e.rule_id for e in result.errors)
+        assert "basis_range_one_amount" in result.error_rule_ids
 
-    def test_range_with_no_amounts(self, parse_xml, create_charge_class):
+    def test_range_with_no_amounts(self, parse_xml, create_charge_class, create_document):
         """Range basis with no Amounts elements - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -386,19 +330,15 @@ class TestBasisRange:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_range_one_amount" in e.rule_id for e in result.errors)
+        assert "basis_range_one_amount" in result.error_rule_ids
 
-    def test_range_with_three_amounts(self, parse_xml, create_charge_class):
+    def test_range_with_three_amounts(self, parse_xml, create_charge_class, create_document):
         """Range basis with three Amounts elements - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -415,19 +355,15 @@ class TestBasisRange:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_range_one_amount" in e.rule_id for e in result.errors)
+        assert "basis_range_one_amount" in result.error_rule_ids
 
-    def test_range_with_dash_separated_in_one_element(self, parse_xml, create_charge_class):
+    def test_range_with_dash_separated_in_one_element(self, parse_xml, create_charge_class, create_document):
         """Range basis with dash-separated values in single element - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -442,19 +378,15 @@ class TestBasisRange:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_range_one_amount" in e.rule_id for e in result.errors)
+        assert "basis_range_one_amount" in result.error_rule_ids
 
-    def test_range_with_comma_separated_in_one_element(self, parse_xml, create_charge_class):
+    def test_range_with_comma_separated_in_one_element(self, parse_xml, create_charge_class, create_document):
         """Range basis with comma-separated values in single element - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -469,23 +401,19 @@ class TestBasisRange:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_range_one_amount" in e.rule_id for e in result.errors)
+        assert "basis_range_one_amount" in result.error_rule_ids
 
 
 class TestBasisStepped:
     """Test basis_stepped_* rules."""
 
-    def test_stepped_with_multiple_amounts(self, parse_xml, create_charge_class):
+    def test_stepped_with_multiple_amounts(self, parse_xml, create_charge_class, create_document):
         """Stepped basis with multiple Amounts - should pass."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -508,18 +436,14 @@ class TestBasisStepped:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("RENT", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("RENT", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         # Should pass with proper stepped structure
 
-    def test_stepped_with_single_amount(self, parse_xml, create_charge_class):
+    def test_stepped_with_single_amount(self, parse_xml, create_charge_class, create_document):
         """Stepped basis with only one Amount - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -535,19 +459,15 @@ class TestBasisStepped:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("RENT", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("RENT", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_stepped_min_two" in e.rule_id for e in result.errors)
+        assert "basis_stepped_min_two" in result.error_rule_ids
 
-    def test_stepped_with_descending_order(self, parse_xml, create_charge_class):
+    def test_stepped_with_descending_order(self, parse_xml, create_charge_class, create_document):
         """Stepped basis with amounts in descending order - should pass/warn."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -567,11 +487,7 @@ class TestBasisStepped:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("RENT", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("RENT", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
@@ -582,7 +498,7 @@ class TestBasisStepped:
 class TestBasisVariable:
     """Test basis_variable_* rules."""
 
-    def test_variable_with_amounts_only(self, parse_xml, create_charge_class):
+    def test_variable_with_amounts_only(self, parse_xml, create_charge_class, create_document):
         """Variable basis with Amounts only - should pass."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -597,18 +513,14 @@ class TestBasisVariable:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         # Variable with text amounts is allowed
 
-    def test_variable_with_percentage_only(self, parse_xml, create_charge_class):
+    def test_variable_with_percentage_only(self, parse_xml, create_charge_class, create_document):
         """Variable basis with Percentage only - should pass."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -624,18 +536,14 @@ class TestBasisVariable:
                 <PercentageOfCode>base_rent</PercentageOfCode>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         # Variable with percentage is allowed
 
-    def test_variable_with_both(self, parse_xml, create_charge_class):
+    def test_variable_with_both(self, parse_xml, create_charge_class, create_document):
         """Variable basis with both Amounts and Percentage - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Test</Name>
@@ -650,23 +558,19 @@ class TestBasisVariable:
                 <Percentage>Varies</Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("FEE", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("FEE", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_variable_not_both" in e.rule_id for e in result.errors)
+        assert "basis_variable_not_both" in result.error_rule_ids
 
 
 class TestBasisIncluded:
     """Test basis_included_* rules."""
 
-    def test_included_with_empty_basis(self, parse_xml, create_charge_class):
+    def test_included_with_empty_basis(self, parse_xml, create_charge_class, create_document):
         """Included item with empty AmountBasis - should pass."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Water</Name>
@@ -681,18 +585,14 @@ class TestBasisIncluded:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("UTIL", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("UTIL", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         # Included items can have empty AmountBasis
 
-    def test_included_with_explicit_basis(self, parse_xml, create_charge_class):
+    def test_included_with_explicit_basis(self, parse_xml, create_charge_class, create_document):
         """Included item with AmountBasis = Explicit - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Water</Name>
@@ -707,19 +607,15 @@ class TestBasisIncluded:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("UTIL", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("UTIL", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_included" in e.rule_id for e in result.errors)
+        assert "basis_included_empty" in result.error_rule_ids
 
-    def test_included_with_populated_amounts(self, parse_xml, create_charge_class):
+    def test_included_with_populated_amounts(self, parse_xml, create_charge_class, create_document):
         """Included item with populated Amounts - should fail."""
         item = """<ChargeOfferItem InternalCode="fee1">
             <Name>Water</Name>
@@ -734,15 +630,11 @@ class TestBasisIncluded:
                 <Percentage></Percentage>
             </ChargeOfferAmount>
         </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("UTIL", item)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("UTIL", item))
         root = parse_xml(xml)
         validator = AmountBasisValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("basis_included_amounts_empty" in e.rule_id for e in result.errors)
+        assert "basis_included_amounts_empty" in result.error_rule_ids
 
@@ -0,0 +1,74 @@
+"""
+Unit tests for the shared validation result model.
+"""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from app.validators.mits.base import ValidationMessage, ValidationResult, ValidationSeverity
+
+
+class TestErrorRuleIds:
+    """Test the cached ValidationResult.error_rule_ids view."""
+
+    def test_reused_until_errors_change(self):
+        """The same frozenset is returned until an error is added."""
+        result = ValidationResult(valid=True)
+        result.add_error(rule_id="item_has_name", message="missing")
+
+        first = result.error_rule_ids
+        assert first == {"item_has_name"}
+        assert result.error_rule_ids is first
+
+        result.add_error(rule_id="item_has_description", message="missing")
+        assert result.error_rule_ids == {"item_has_name", "item_has_description"}
+
+    def test_refreshed_by_merge(self):
+        """Merging a result with errors refreshes the cached rule IDs."""
+        result = ValidationResult(valid=True)
+        assert result.error_rule_ids == frozenset()
+
+        other = ValidationResult(valid=True)
+        other.add_error(rule_id="property_has_id", message="missing")
+        result.merge(other)
+
+        assert result.error_rule_ids == {"property_has_id"}
+
+
+class TestErrorsByRule:
+    """Test the ValidationResult.errors_by_rule index."""
+
+    def test_index_matches_errors(self):
+        """Errors are indexed by rule ID without changing their overall order."""
+        result = ValidationResult(valid=True)
+        result.add_error(rule_id="item_has_name", message="first")
+        result.add_error(rule_id="item_has_description", message="second")
+        result.add_error(rule_id="item_has_name", message="third")
+
+        assert [e.message for e in result.errors] == ["first", "second", "third"]
+        assert [e.message for e in result.errors_by_rule["item_has_name"]] == ["first", "third"]
+
+    def test_merge_and_constructor_are_indexed(self):
+        """Errors arriving through merge() or the constructor are indexed too."""
+        seeded = ValidationResult(valid=True)
+        seeded.add_error(rule_id="property_has_id", message="missing")
+
+        copy = ValidationResult(valid=False, errors=list(seeded.errors))
+        copy.merge(seeded)
+
+        assert len(copy.errors_by_rule["property_has_id"]) == 2
+
+
+class TestValidationMessage:
+    """Test the ValidationMessage layout."""
+
+    def test_frozen_with_slots(self):
+        """Messages are immutable and carry no per-instance __dict__."""
+        message = ValidationMessage(
+            rule_id="item_has_name", severity=ValidationSeverity.ERROR, message="missing"
+        )
+
+        assert not hasattr(message, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            message.message = "changed"
@@ -17,13 +17,9 @@ from app.validators.mits.charge_class import ChargeClassValidator
 class TestClassHasCode:
     """Test class_has_code rule."""
 
-    def test_class_with_code(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_with_code(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass with Code attribute - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class(code="APP", content=create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class(code="APP", content=create_charge_item()))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
@@ -44,7 +40,7 @@ class TestClassHasCode:
         result = validator.validate()
         
         assert result.valid is False
-        assert any("class_has_code" in e.rule_id for e in result.errors)
+        assert "class_has_code" in result.error_rule_ids
 
     def test_class_with_empty_code(self, parse_xml, create_charge_item):
         """ChargeOfferClass with empty Code - should fail."""
@@ -60,7 +56,7 @@ class TestClassHasCode:
         result = validator.validate()
         
         assert result.valid is False
-        assert any("class_has_code" in e.rule_id for e in result.errors)
+        assert "class_has_code" in result.error_rule_ids
 
     def test_multiple_classes_all_have_codes(self, parse_xml, create_charge_class, create_charge_item):
         """Multiple ChargeOfferClass elements all with Code - should pass."""
@@ -125,7 +121,7 @@ class TestClassCodeUniqueInParent:
         result = validator.validate()
         
         assert result.valid is False
-        assert any("class_code_unique_in_parent" in e.rule_id for e in result.errors)
+        assert "class_code_unique_in_parent" in result.error_rule_ids
 
     def test_case_sensitive_codes(self, parse_xml, create_charge_class, create_charge_item):
         """ChargeOfferClass Codes are case-sensitive - should pass."""
@@ -146,13 +142,9 @@ class TestClassCodeUniqueInParent:
 class TestClassHasItems:
     """Test class_has_items rule."""
 
-    def test_class_with_items(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_with_items(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass with ChargeOfferItem - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item()))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
@@ -171,29 +163,21 @@ class TestClassHasItems:
         result = validator.validate()
         
         assert result.valid is False
-        assert any("class_has_items" in e.rule_id for e in result.errors)
+        assert "class_has_items" in result.error_rule_ids
 
-    def test_class_with_multiple_items(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_with_multiple_items(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass with multiple items - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(internal_code="fee1") + create_charge_item(internal_code="fee2"))}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item(internal_code="fee1") + create_charge_item(internal_code="fee2")))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_class_with_nested_class(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_with_nested_class(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass with nested ChargeOfferClass - should pass."""
         inner_class = create_charge_class("SUB", create_charge_item(internal_code="sub1"))
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", inner_class)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", inner_class))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
@@ -204,26 +188,18 @@ class TestClassHasItems:
 class TestClassNoEmptyChildren:
     """Test class_no_empty_children rule."""
 
-    def test_class_with_items_no_empty_children(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_with_items_no_empty_children(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass with items, no empty nested classes - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item()))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_class_with_empty_nested_class(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_with_empty_nested_class(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass with empty nested ChargeOfferClass - should fail."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item() + '<ChargeOfferClass Code="EMPTY"/>')}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item() + '<ChargeOfferClass Code="EMPTY"/>'))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
@@ -235,20 +211,16 @@ class TestClassNoEmptyChildren:
 class TestClassLimitsOptional:
     """Test class_limits_optional rule."""
 
-    def test_class_without_limits(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_without_limits(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass without ChargeOfferClassLimit - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item()))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_class_with_limits(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_with_limits(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass with ChargeOfferClassLimit - should pass."""
         limit = """<ChargeOfferClassLimit>
             <MaxOccurrences>3</MaxOccurrences>
@@ -256,18 +228,14 @@ class TestClassLimitsOptional:
                 <InternalCode>fee1</InternalCode>
             </AppliesTo>
         </ChargeOfferClassLimit>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item() + limit)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item() + limit))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
         
         # Limits are optional, should pass
 
-    def test_class_with_multiple_limits(self, parse_xml, create_charge_class, create_charge_item):
+    def test_class_with_multiple_limits(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """ChargeOfferClass with multiple limits - should pass."""
         limits = """<ChargeOfferClassLimit>
             <MaxOccurrences>3</MaxOccurrences>
@@ -281,11 +249,7 @@ class TestClassLimitsOptional:
                 <InternalCode>fee1</InternalCode>
             </AppliesTo>
         </ChargeOfferClassLimit>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item() + limits)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class("APP", create_charge_item() + limits))
         root = parse_xml(xml)
         validator = ChargeClassValidator(root)
         result = validator.validate()
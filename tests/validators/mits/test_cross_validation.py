@@ -0,0 +1,72 @@
+"""
+Unit tests for Cross Validation (Sections N, O, P).
+
+Tests percentage-of reference rules:
+- reference_no_self
+- reference_no_circular
+"""
+
+from app.validators.mits.cross_validation import CrossValidation
+
+
+class TestReferenceNoCircular:
+    """Test reference_no_circular rule."""
+
+    def _percentage_item(self, create_charge_item, code: str, target: str) -> str:
+        return create_charge_item(
+            internal_code=code,
+            amount_basis="Percentage Of",
+            extra_content=f"<PercentageOfCode>{target}</PercentageOfCode>",
+        )
+
+    def test_acyclic_chain(self, parse_xml, create_charge_class, create_charge_item, create_document):
+        """Chain a -> b -> base without a cycle - should not be flagged."""
+        items = (
+            self._percentage_item(create_charge_item, "a", "b")
+            + self._percentage_item(create_charge_item, "b", "base")
+            + create_charge_item(internal_code="base")
+        )
+        xml = create_document(create_charge_class("APP", items))
+        root = parse_xml(xml)
+        validator = CrossValidation(root)
+        result = validator.validate()
+
+        assert "reference_no_circular" not in result.error_rule_ids
+
+    def test_two_item_cycle(self, parse_xml, create_charge_class, create_charge_item, create_document):
+        """Items referencing each other - both should be flagged."""
+        items = self._percentage_item(create_charge_item, "a", "b") + self._percentage_item(
+            create_charge_item, "b", "a"
+        )
+        xml = create_document(create_charge_class("APP", items))
+        root = parse_xml(xml)
+        validator = CrossValidation(root)
+        result = validator.validate()
+
+        circular = result.errors_by_rule["reference_no_circular"]
+        assert sorted(e.details["item_code"] for e in circular) == ["a", "b"]
+
+    def test_chain_into_cycle(self, parse_xml, create_charge_class, create_charge_item, create_document):
+        """Item whose chain leads into a cycle - should be flagged too."""
+        items = (
+            self._percentage_item(create_charge_item, "lead", "a")
+            + self._percentage_item(create_charge_item, "a", "b")
+            + self._percentage_item(create_charge_item, "b", "a")
+        )
+        xml = create_document(create_charge_class("APP", items))
+        root = parse_xml(xml)
+        validator = CrossValidation(root)
+        result = validator.validate()
+
+        circular = result.errors_by_rule["reference_no_circular"]
+        assert sorted(e.details["item_code"] for e in circular) == ["a", "b", "lead"]
+
+    def test_self_reference(self, parse_xml, create_charge_class, create_charge_item, create_document):
+        """Item referencing itself - reported as self-reference, not circular."""
+        xml = create_document(create_charge_class("APP", self._percentage_item(create_charge_item, "a", "a")))
+        root = parse_xml(xml)
+        validator = CrossValidation(root)
+        result = validator.validate()
+
+        assert "reference_no_self" in result.error_rule_ids
+        assert "reference_no_circular" not in result.error_rule_ids
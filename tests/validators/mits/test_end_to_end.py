@@ -7,9 +7,8 @@ Tests the full validation pipeline with real-world XML files.
 import pytest
 from pathlib import Path
 
-from app.validators.mits import validate_mits_document
-
 
+@pytest.mark.xdist_group("test_full_xml")
 class TestFullXML:
     """End-to-end tests using test_full.xml."""
     
@@ -27,9 +26,9 @@ class TestFullXML:
         assert "<?xml" in full_xml
         assert "<PhysicalProperty>" in full_xml
     
-    def test_full_xml_validation(self, full_xml):
+    def test_full_xml_validation(self, full_xml, validate_document):
         """test_full.xml should go through complete validation pipeline."""
-        result = validate_mits_document(full_xml)
+        result = validate_document(full_xml)
         
         # Result should have expected structure
         assert "valid" in result
@@ -54,9 +53,9 @@ class TestFullXML:
             for warning in result['warnings'][:5]:  # First 5 warnings
                 print(f"  - {warning}")
     
-    def test_full_xml_xml_structure_rules(self, full_xml):
+    def test_full_xml_xml_structure_rules(self, full_xml, validate_document):
         """test_full.xml should pass XML structure validation."""
-        result = validate_mits_document(full_xml)
+        result = validate_document(full_xml)
         
         # Should not have basic XML structure errors
         xml_structure_errors = [
@@ -75,9 +74,9 @@ class TestFullXML:
                 print(f"  - {error}")
         
         # Basic structure should be valid
-        assert not any('xml_wellformed' in e for e in result['errors']), \
+        assert 'xml_wellformed' not in result['rule_ids'], \
             "XML should be well-formed"
-        assert not any('root_is_physical_property' in e for e in result['errors']), \
+        assert 'root_is_physical_property' not in result['rule_ids'], \
             "Root should be PhysicalProperty"
     
     def test_full_xml_property_count(self, full_xml):
@@ -106,9 +105,9 @@ class TestFullXML:
         
         assert len(properties) > 0, "Should have at least one property"
     
-    def test_full_xml_validation_categories(self, full_xml):
+    def test_full_xml_validation_categories(self, full_xml, validate_document):
         """Categorize validation results from test_full.xml."""
-        result = validate_mits_document(full_xml)
+        result = validate_document(full_xml)
         
         # Categorize errors by validator type
         categories = {
@@ -184,6 +183,7 @@ class TestFullXML:
                     print(f"  ... and {len(errors) - 3} more")
 
 
+@pytest.mark.xdist_group("test_partial_xml")
 class TestPartialXML:
     """End-to-end tests using test_partial.xml."""
     
@@ -202,9 +202,9 @@ class TestPartialXML:
         assert "<?xml" in partial_xml
         assert "<PhysicalProperty>" in partial_xml
     
-    def test_partial_xml_validation(self, partial_xml):
+    def test_partial_xml_validation(self, partial_xml, validate_document):
         """test_partial.xml should go through complete validation pipeline."""
-        result = validate_mits_document(partial_xml)
+        result = validate_document(partial_xml)
         
         # Result should have expected structure
         assert "valid" in result
@@ -251,7 +251,7 @@ class TestPartialXML:
 class TestEndToEndScenarios:
     """Additional end-to-end test scenarios."""
     
-    def test_minimal_valid_document(self):
+    def test_minimal_valid_document(self, validate_document):
         """Test with minimal valid MITS document."""
         xml = """<?xml version="1.0" encoding="UTF-8"?>
 <PhysicalProperty>
@@ -275,12 +275,12 @@ class TestEndToEndScenarios:
     </Property>
 </PhysicalProperty>"""
         
-        result = validate_mits_document(xml)
+        result = validate_document(xml)
         
         assert result['valid'] is True, f"Minimal document should be valid. Errors: {result['errors']}"
         assert len(result['errors']) == 0
     
-    def test_multiple_properties(self):
+    def test_multiple_properties(self, validate_document):
         """Test document with multiple properties."""
         xml = """<?xml version="1.0" encoding="UTF-8"?>
 <PhysicalProperty>
@@ -322,24 +322,24 @@ class TestEndToEndScenarios:
     </Property>
 </PhysicalProperty>"""
         
-        result = validate_mits_document(xml)
+        result = validate_document(xml)
         
         # Should handle multiple properties correctly
-        assert 'property_id_unique' not in str(result['errors'])
+        assert 'property_id_unique' not in result['rule_ids']
     
-    def test_validation_stops_on_critical_errors(self):
+    def test_validation_stops_on_critical_errors(self, validate_document):
         """Test that validation stops early on critical XML errors."""
         xml = """<?xml version="1.0" encoding="UTF-8"?>
 <WrongRoot>
     <Property IDValue="1"/>
 </WrongRoot>"""
         
-        result = validate_mits_document(xml)
+        result = validate_document(xml)
         
         assert result['valid'] is False
-        assert any('root_is_physical_property' in e for e in result['errors'])
+        assert 'root_is_physical_property' in result['rule_ids']
     
-    def test_complex_hierarchy(self):
+    def test_complex_hierarchy(self, validate_document):
         """Test document with Building/Floorplan/Unit hierarchy."""
         xml = """<?xml version="1.0" encoding="UTF-8"?>
 <PhysicalProperty>
@@ -369,7 +369,7 @@ class TestEndToEndScenarios:
     </Property>
 </PhysicalProperty>"""
         
-        result = validate_mits_document(xml)
+        result = validate_document(xml)
         
         # Should handle hierarchy correctly
         if not result['valid']:
@@ -17,13 +17,9 @@ from app.validators.mits.fee_hierarchy import FeeHierarchyValidator
 class TestFeeInValidParent:
     """Test fee_in_valid_parent rule."""
 
-    def test_fee_in_property(self, parse_xml, create_charge_class, create_charge_item):
+    def test_fee_in_property(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """Fee directly in Property - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class(content=create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class(content=create_charge_item()))
         root = parse_xml(xml)
         validator = FeeHierarchyValidator(root)
         result = validator.validate()
@@ -101,26 +97,18 @@ class TestFeeInValidParent:
 class TestFeeUsesClassContainer:
     """Test fee_uses_class_container rule."""
 
-    def test_fee_in_charge_class(self, parse_xml, create_charge_class, create_charge_item):
+    def test_fee_in_charge_class(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """Fee item inside ChargeOfferClass - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class(content=create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class(content=create_charge_item()))
         root = parse_xml(xml)
         validator = FeeHierarchyValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_fee_not_in_class(self, parse_xml, create_charge_item):
+    def test_fee_not_in_class(self, parse_xml, create_charge_item, create_document):
         """Fee item not in ChargeOfferClass - should fail."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_item()}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_item())
         root = parse_xml(xml)
         validator = FeeHierarchyValidator(root)
         result = validator.validate()
@@ -131,27 +119,19 @@ class TestFeeUsesClassContainer:
 class TestClassItemAmountStructure:
     """Test class_item_amount_structure rule."""
 
-    def test_valid_structure(self, parse_xml, create_charge_class, create_charge_item):
+    def test_valid_structure(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """Valid Class > Item > Amount structure - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class(content=create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class(content=create_charge_item()))
         root = parse_xml(xml)
         validator = FeeHierarchyValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_nested_classes(self, parse_xml, create_charge_class, create_charge_item):
+    def test_nested_classes(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """Nested ChargeOfferClass elements - test structure."""
         inner_class = create_charge_class(code="SEC", content=create_charge_item(internal_code="sec1"))
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class(content=inner_class)}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class(content=inner_class))
         root = parse_xml(xml)
         validator = FeeHierarchyValidator(root)
         result = validator.validate()
@@ -162,26 +142,18 @@ class TestClassItemAmountStructure:
 class TestNoFeeOutsideHierarchy:
     """Test no_fee_outside_hierarchy rule."""
 
-    def test_fee_in_hierarchy(self, parse_xml, create_charge_class, create_charge_item):
+    def test_fee_in_hierarchy(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """Fee within proper hierarchy - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class(content=create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class(content=create_charge_item()))
         root = parse_xml(xml)
         validator = FeeHierarchyValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_multiple_fees_in_hierarchy(self, parse_xml, create_charge_class, create_charge_item):
+    def test_multiple_fees_in_hierarchy(self, parse_xml, create_charge_class, create_charge_item, create_document):
         """Multiple fees in hierarchy - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class(content=create_charge_item(internal_code="fee1") + create_charge_item(internal_code="fee2"))}
-            </Property>
-        </PhysicalProperty>"""
+        xml = create_document(create_charge_class(content=create_charge_item(internal_code="fee1") + create_charge_item(internal_code="fee2")))
         root = parse_xml(xml)
         validator = FeeHierarchyValidator(root)
         result = validator.validate()
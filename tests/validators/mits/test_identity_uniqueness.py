@@ -44,7 +44,7 @@ class TestBuildingIdUnique:
         result = validator.validate()
         
         assert result.valid is False
-        assert any("building_id_unique" in e.rule_id for e in result.errors)
+        assert "building_id_unique" in result.error_rule_ids
 
     def test_no_buildings(self, parse_xml):
         """No Buildings - should pass."""
@@ -107,7 +107,7 @@ class TestFloorplanIdUnique:
         result = validator.validate()
         
         assert result.valid is False
-        assert any("floorplan_id_unique" in e.rule_id for e in result.errors)
+        assert "floorplan_id_unique" in result.error_rule_ids
 
     def test_floorplans_across_buildings(self, parse_xml):
         """Same Floorplan ID in different Buildings - should pass."""
@@ -169,7 +169,7 @@ class TestUnitIdUnique:
         result = validator.validate()
         
         assert result.valid is False
-        assert any("unit_id_unique" in e.rule_id for e in result.errors)
+        assert "unit_id_unique" in result.error_rule_ids
 
     def test_units_across_floorplans(self, parse_xml):
         """Same Unit ID in different Floorplans - depends on scope."""
@@ -12,366 +12,353 @@ Tests all rules (13 total):
 - char_refund_per_type_valid
 """
 
+import copy
+from typing import Final, Union
+from xml.etree.ElementTree import Element, SubElement, fromstring
+
 import pytest
+
 from app.validators.mits.item_characteristics import ItemCharacteristicsValidator
 
+# Shared <PhysicalProperty><Property IDValue="1"/></PhysicalProperty> skeleton
+_BASE = Element("PhysicalProperty")
+SubElement(_BASE, "Property", IDValue="1")
+
+
+def wrap(class_code: str, item_xml: Union[str, bytes]) -> Element:
+    """Copy the shared skeleton and place the item in a ChargeOfferClass inside its Property."""
+    root = copy.deepcopy(_BASE)
+    charge_class = SubElement(root[0], "ChargeOfferClass", Code=class_code)
+    charge_class.append(fromstring(item_xml))
+    return root
+
+
+def _build_item(class_code: str, lifecycle: str, frequency: str) -> Element:
+    """Build a ChargeOfferClass holding a single item with the given PaymentFrequency."""
+    charge_class = Element("ChargeOfferClass", Code=class_code)
+    item = SubElement(charge_class, "ChargeOfferItem", InternalCode="fee1")
+    SubElement(item, "Name").text = "Test"
+    SubElement(item, "Description").text = "Test"
+    characteristics = SubElement(item, "Characteristics")
+    SubElement(characteristics, "ChargeRequirement").text = "Mandatory"
+    SubElement(characteristics, "Lifecycle").text = lifecycle
+    SubElement(characteristics, "PaymentFrequency").text = frequency
+    SubElement(item, "AmountBasis").text = "Explicit"
+    amount = SubElement(item, "ChargeOfferAmount")
+    SubElement(amount, "Amounts").text = "50"
+    SubElement(amount, "Percentage")
+    return charge_class
+
+
+_ITEM_NO_REQUIREMENT: Final[bytes] = b"""<ChargeOfferItem InternalCode="fee1">
+    <Name>Test</Name>
+    <Description>Test</Description>
+    <Characteristics>
+        <Lifecycle>At Application</Lifecycle>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_CONDITIONAL_SCOPE: Final[bytes] = b"""<ChargeOfferItem InternalCode="pet_fee">
+    <Name>Pet Fee</Name>
+    <Description>Monthly pet fee</Description>
+    <Characteristics>
+        <ChargeRequirement>Conditional</ChargeRequirement>
+        <ConditionalScope>
+            <InternalCode>pet_allowed</InternalCode>
+        </ConditionalScope>
+        <Lifecycle>During Term</Lifecycle>
+        <PaymentFrequency>Monthly</PaymentFrequency>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_CONDITIONAL_NO_CODES: Final[bytes] = b"""<ChargeOfferItem InternalCode="pet_fee">
+    <Name>Pet Fee</Name>
+    <Description>Monthly pet fee</Description>
+    <Characteristics>
+        <ChargeRequirement>Conditional</ChargeRequirement>
+        <ConditionalScope>
+        </ConditionalScope>
+        <Lifecycle>During Term</Lifecycle>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_CONDITIONAL_SELF_REFERENCE: Final[bytes] = b"""<ChargeOfferItem InternalCode="pet_fee">
+    <Name>Pet Fee</Name>
+    <Description>Monthly pet fee</Description>
+    <Characteristics>
+        <ChargeRequirement>Conditional</ChargeRequirement>
+        <ConditionalScope>
+            <InternalCode>pet_fee</InternalCode>
+        </ConditionalScope>
+        <Lifecycle>During Term</Lifecycle>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_NO_LIFECYCLE: Final[bytes] = b"""<ChargeOfferItem InternalCode="fee1">
+    <Name>Test</Name>
+    <Description>Test</Description>
+    <Characteristics>
+        <ChargeRequirement>Mandatory</ChargeRequirement>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_REFUNDABLE: Final[bytes] = b"""<ChargeOfferItem InternalCode="sec_dep">
+    <Name>Security Deposit</Name>
+    <Description>Refundable security deposit</Description>
+    <Characteristics>
+        <ChargeRequirement>Mandatory</ChargeRequirement>
+        <Lifecycle>At Move-In</Lifecycle>
+        <PaymentFrequency>One-time</PaymentFrequency>
+        <Refundability>Refundable</Refundability>
+        <RefundDetails>
+            <RefundMax>1000.00</RefundMax>
+            <RefundMaxType>Amount</RefundMaxType>
+            <RefundPerType>Per Unit</RefundPerType>
+        </RefundDetails>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_REFUNDABLE_NO_DETAILS: Final[bytes] = b"""<ChargeOfferItem InternalCode="sec_dep">
+    <Name>Security Deposit</Name>
+    <Description>Refundable security deposit</Description>
+    <Characteristics>
+        <ChargeRequirement>Mandatory</ChargeRequirement>
+        <Lifecycle>At Move-In</Lifecycle>
+        <PaymentFrequency>One-time</PaymentFrequency>
+        <Refundability>Refundable</Refundability>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_REFUND_NO_MAX: Final[bytes] = b"""<ChargeOfferItem InternalCode="sec_dep">
+    <Name>Security Deposit</Name>
+    <Description>Refundable security deposit</Description>
+    <Characteristics>
+        <ChargeRequirement>Mandatory</ChargeRequirement>
+        <Lifecycle>At Move-In</Lifecycle>
+        <PaymentFrequency>One-time</PaymentFrequency>
+        <Refundability>Refundable</Refundability>
+        <RefundDetails>
+            <RefundMaxType>Amount</RefundMaxType>
+        </RefundDetails>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_REFUND_NO_MAX_TYPE: Final[bytes] = b"""<ChargeOfferItem InternalCode="sec_dep">
+    <Name>Security Deposit</Name>
+    <Description>Refundable security deposit</Description>
+    <Characteristics>
+        <ChargeRequirement>Mandatory</ChargeRequirement>
+        <Lifecycle>At Move-In</Lifecycle>
+        <PaymentFrequency>One-time</PaymentFrequency>
+        <Refundability>Refundable</Refundability>
+        <RefundDetails>
+            <RefundMax>1000.00</RefundMax>
+        </RefundDetails>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_NON_REFUNDABLE: Final[bytes] = b"""<ChargeOfferItem InternalCode="app_fee">
+    <Name>Application Fee</Name>
+    <Description>Non-refundable application fee</Description>
+    <Characteristics>
+        <ChargeRequirement>Mandatory</ChargeRequirement>
+        <Lifecycle>At Application</Lifecycle>
+        <PaymentFrequency>One-time</PaymentFrequency>
+        <Refundability>Non-refundable</Refundability>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
+_ITEM_INVALID_REFUND_PER_TYPE: Final[bytes] = b"""<ChargeOfferItem InternalCode="sec_dep">
+    <Name>Security Deposit</Name>
+    <Description>Refundable security deposit</Description>
+    <Characteristics>
+        <ChargeRequirement>Mandatory</ChargeRequirement>
+        <Lifecycle>At Move-In</Lifecycle>
+        <PaymentFrequency>One-time</PaymentFrequency>
+        <Refundability>Refundable</Refundability>
+        <RefundDetails>
+            <RefundMax>1000.00</RefundMax>
+            <RefundMaxType>Amount</RefundMaxType>
+            <RefundPerType>InvalidValue</RefundPerType>
+        </RefundDetails>
+    </Characteristics>
+    <AmountBasis>Explicit</AmountBasis>
+    <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
+</ChargeOfferItem>"""
+
 
 class TestCharRequirementRequired:
     """Test char_requirement_required rule."""
 
-    def test_item_with_requirement(self, parse_xml, create_charge_class, create_charge_item):
+    def test_item_with_requirement(self, create_charge_item):
         """Item with ChargeRequirement - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(requirement="Mandatory"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("APP", create_charge_item(requirement="Mandatory"))
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_item_without_requirement(self, parse_xml, create_charge_class):
+    def test_item_without_requirement(self):
         """Item without ChargeRequirement - should fail."""
-        item = """<ChargeOfferItem InternalCode="fee1">
-            <Name>Test</Name>
-            <Description>Test</Description>
-            <Characteristics>
-                <Lifecycle>At Application</Lifecycle>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("APP", _ITEM_NO_REQUIREMENT)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("char_requirement_required" in e.rule_id for e in result.errors)
+        assert "char_requirement_required" in result.error_rule_ids
 
 
 class TestCharConditional:
     """Test char_conditional_* rules."""
 
-    def test_conditional_with_valid_scope(self, parse_xml, create_charge_class):
+    def test_conditional_with_valid_scope(self):
         """Conditional item with ConditionalScope - should pass."""
-        item = """<ChargeOfferItem InternalCode="pet_fee">
-            <Name>Pet Fee</Name>
-            <Description>Monthly pet fee</Description>
-            <Characteristics>
-                <ChargeRequirement>Conditional</ChargeRequirement>
-                <ConditionalScope>
-                    <InternalCode>pet_allowed</InternalCode>
-                </ConditionalScope>
-                <Lifecycle>During Term</Lifecycle>
-                <PaymentFrequency>Monthly</PaymentFrequency>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("PET", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("PET", _ITEM_CONDITIONAL_SCOPE)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         # Should validate conditional scope structure
 
-    def test_conditional_without_codes(self, parse_xml, create_charge_class):
+    def test_conditional_without_codes(self):
         """Conditional with ConditionalScope but no codes - should fail."""
-        item = """<ChargeOfferItem InternalCode="pet_fee">
-            <Name>Pet Fee</Name>
-            <Description>Monthly pet fee</Description>
-            <Characteristics>
-                <ChargeRequirement>Conditional</ChargeRequirement>
-                <ConditionalScope>
-                </ConditionalScope>
-                <Lifecycle>During Term</Lifecycle>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("PET", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("PET", _ITEM_CONDITIONAL_NO_CODES)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("char_conditional_has_codes" in e.rule_id for e in result.errors)
+        assert "char_conditional_has_codes" in result.error_rule_ids
 
-    def test_conditional_self_reference(self, parse_xml, create_charge_class):
+    def test_conditional_self_reference(self):
         """Conditional item referencing itself - should fail."""
-        item = """<ChargeOfferItem InternalCode="pet_fee">
-            <Name>Pet Fee</Name>
-            <Description>Monthly pet fee</Description>
-            <Characteristics>
-                <ChargeRequirement>Conditional</ChargeRequirement>
-                <ConditionalScope>
-                    <InternalCode>pet_fee</InternalCode>
-                </ConditionalScope>
-                <Lifecycle>During Term</Lifecycle>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("PET", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("PET", _ITEM_CONDITIONAL_SELF_REFERENCE)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("char_no_self_reference" in e.rule_id for e in result.errors)
+        assert "char_no_self_reference" in result.error_rule_ids
 
 
 class TestCharLifecycleRequired:
     """Test char_lifecycle_required rule."""
 
-    def test_item_with_lifecycle(self, parse_xml, create_charge_class, create_charge_item):
+    def test_item_with_lifecycle(self, create_charge_item):
         """Item with Lifecycle - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(lifecycle="At Application"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("APP", create_charge_item(lifecycle="At Application"))
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is True
 
-    def test_item_without_lifecycle(self, parse_xml, create_charge_class):
+    def test_item_without_lifecycle(self):
         """Item without Lifecycle - should fail."""
-        item = """<ChargeOfferItem InternalCode="fee1">
-            <Name>Test</Name>
-            <Description>Test</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("APP", _ITEM_NO_LIFECYCLE)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("char_lifecycle_required" in e.rule_id for e in result.errors)
+        assert "char_lifecycle_required" in result.error_rule_ids
+
+
+_FREQUENCY_CASES = {
+    "one-time": ("APP", "At Application", "One-time"),
+    "monthly": ("RENT", "During Term", "Monthly"),
+    "invalid": ("APP", "During Term", "InvalidValue"),
+}
+
+
+@pytest.fixture(scope="module")
+def frequency_results():
+    """Validate every frequency case once for the whole module."""
+    roots = []
+    for case in _FREQUENCY_CASES.values():
+        root = copy.deepcopy(_BASE)
+        root[0].append(_build_item(*case))
+        roots.append(root)
+    results = [ItemCharacteristicsValidator(root).validate() for root in roots]
+    return dict(zip(_FREQUENCY_CASES, results, strict=True))
 
 
 class TestCharFrequencyValid:
     """Test char_frequency_valid rule."""
 
-    def test_onetime_frequency(self, parse_xml, create_charge_class, create_charge_item):
-        """Item with PaymentFrequency One-time - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(frequency="One-time"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = ItemCharacteristicsValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
+    @pytest.mark.parametrize(
+        "case, expected_valid",
+        [("one-time", True), ("monthly", True), ("invalid", False)],
+    )
+    def test_payment_frequency(self, frequency_results, case, expected_valid):
+        """PaymentFrequency must use a valid enumeration value."""
+        result = frequency_results[case]
 
-    def test_monthly_frequency(self, parse_xml, create_charge_class, create_charge_item):
-        """Item with PaymentFrequency Monthly - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("RENT", create_charge_item(lifecycle="During Term", frequency="Monthly"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = ItemCharacteristicsValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
+        assert result.valid is expected_valid
+        assert ("char_frequency_valid" in result.error_rule_ids) is not expected_valid
 
-    def test_invalid_frequency(self, parse_xml, create_charge_class):
-        """Item with invalid PaymentFrequency - should fail."""
-        item = """<ChargeOfferItem InternalCode="fee1">
-            <Name>Test</Name>
-            <Description>Test</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>During Term</Lifecycle>
-                <PaymentFrequency>InvalidValue</PaymentFrequency>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = ItemCharacteristicsValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-        assert any("char_frequency_valid" in e.rule_id for e in result.errors)
+    def test_batch_results_are_independent(self, frequency_results):
+        """Errors from one document in a batch do not leak into the others."""
+        assert frequency_results["one-time"].errors == []
+        assert len(frequency_results["invalid"].errors) == 1
 
 
 class TestCharRefundability:
     """Test char_refundability_* rules."""
 
-    def test_refundable_with_details(self, parse_xml, create_charge_class):
+    def test_refundable_with_details(self):
         """Refundable item with RefundDetails - should pass."""
-        item = """<ChargeOfferItem InternalCode="sec_dep">
-            <Name>Security Deposit</Name>
-            <Description>Refundable security deposit</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Move-In</Lifecycle>
-                <PaymentFrequency>One-time</PaymentFrequency>
-                <Refundability>Refundable</Refundability>
-                <RefundDetails>
-                    <RefundMax>1000.00</RefundMax>
-                    <RefundMaxType>Amount</RefundMaxType>
-                    <RefundPerType>Per Unit</RefundPerType>
-                </RefundDetails>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("SEC", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("SEC", _ITEM_REFUNDABLE)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         # Should validate refund structure
 
-    def test_refundable_without_details(self, parse_xml, create_charge_class):
+    def test_refundable_without_details(self):
         """Refundable item without RefundDetails - should fail."""
-        item = """<ChargeOfferItem InternalCode="sec_dep">
-            <Name>Security Deposit</Name>
-            <Description>Refundable security deposit</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Move-In</Lifecycle>
-                <PaymentFrequency>One-time</PaymentFrequency>
-                <Refundability>Refundable</Refundability>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("SEC", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("SEC", _ITEM_REFUNDABLE_NO_DETAILS)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("char_refund_details_required" in e.rule_id for e in result.errors)
+        assert "char_refund_details_required" in result.error_rule_ids
 
-    def test_refund_without_max(self, parse_xml, create_charge_class):
+    def test_refund_without_max(self):
         """RefundDetails without RefundMax - should fail."""
-        item = """<ChargeOfferItem InternalCode="sec_dep">
-            <Name>Security Deposit</Name>
-            <Description>Refundable security deposit</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Move-In</Lifecycle>
-                <PaymentFrequency>One-time</PaymentFrequency>
-                <Refundability>Refundable</Refundability>
-                <RefundDetails>
-                    <RefundMaxType>Amount</RefundMaxType>
-                </RefundDetails>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("SEC", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("SEC", _ITEM_REFUND_NO_MAX)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("char_refund_max_required" in e.rule_id for e in result.errors)
+        assert "char_refund_max_required" in result.error_rule_ids
 
-    def test_refund_without_max_type(self, parse_xml, create_charge_class):
+    def test_refund_without_max_type(self):
         """RefundDetails without RefundMaxType - should fail."""
-        item = """<ChargeOfferItem InternalCode="sec_dep">
-            <Name>Security Deposit</Name>
-            <Description>Refundable security deposit</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Move-In</Lifecycle>
-                <PaymentFrequency>One-time</PaymentFrequency>
-                <Refundability>Refundable</Refundability>
-                <RefundDetails>
-                    <RefundMax>1000.00</RefundMax>
-                </RefundDetails>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("SEC", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("SEC", _ITEM_REFUND_NO_MAX_TYPE)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("char_refund_max_type_required" in e.rule_id for e in result.errors)
+        assert "char_refund_max_type_required" in result.error_rule_ids
 
-    def test_nonrefundable_no_details(self, parse_xml, create_charge_class):
+    def test_nonrefundable_no_details(self):
         """Non-refundable item without RefundDetails - should pass."""
-        item = """<ChargeOfferItem InternalCode="app_fee">
-            <Name>Application Fee</Name>
-            <Description>Non-refundable application fee</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Application</Lifecycle>
-                <PaymentFrequency>One-time</PaymentFrequency>
-                <Refundability>Non-refundable</Refundability>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("APP", _ITEM_NON_REFUNDABLE)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
@@ -381,64 +368,20 @@ class TestCharRefundability:
 class TestCharRefundPerType:
     """Test char_refund_per_type_valid rule."""
 
-    def test_valid_refund_per_type(self, parse_xml, create_charge_class):
+    def test_valid_refund_per_type(self):
         """RefundPerType with valid value - should pass."""
-        item = """<ChargeOfferItem InternalCode="sec_dep">
-            <Name>Security Deposit</Name>
-            <Description>Refundable security deposit</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Move-In</Lifecycle>
-                <PaymentFrequency>One-time</PaymentFrequency>
-                <Refundability>Refundable</Refundability>
-                <RefundDetails>
-                    <RefundMax>1000.00</RefundMax>
-                    <RefundMaxType>Amount</RefundMaxType>
-                    <RefundPerType>Per Unit</RefundPerType>
-                </RefundDetails>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("SEC", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("SEC", _ITEM_REFUNDABLE)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         # Valid RefundPerType values: Per Unit, Per Applicant, etc.
 
-    def test_invalid_refund_per_type(self, parse_xml, create_charge_class):
+    def test_invalid_refund_per_type(self):
         """RefundPerType with invalid value - should fail."""
-        item = """<ChargeOfferItem InternalCode="sec_dep">
-            <Name>Security Deposit</Name>
-            <Description>Refundable security deposit</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Move-In</Lifecycle>
-                <PaymentFrequency>One-time</PaymentFrequency>
-                <Refundability>Refundable</Refundability>
-                <RefundDetails>
-                    <RefundMax>1000.00</RefundMax>
-                    <RefundMaxType>Amount</RefundMaxType>
-                    <RefundPerType>InvalidValue</RefundPerType>
-                </RefundDetails>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>1000</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("SEC", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
+        root = wrap("SEC", _ITEM_INVALID_REFUND_PER_TYPE)
         validator = ItemCharacteristicsValidator(root)
         result = validator.validate()
         
         assert result.valid is False
-        assert any("char_refund_per_type_valid" in e.rule_id for e in result.errors)
+        assert "char_refund_per_type_valid" in result.error_rule_ids
 
@@ -9,324 +9,135 @@ Tests key rules from the 15 rules:
 - item_has_one_characteristics
 - item_has_amount_blocks
 - item_amount_basis_required
+
+Every case is a mutation of the shared baseline document from conftest.
 """
 
+import copy
+from typing import Callable, NamedTuple, Optional, Tuple
+from xml.etree.ElementTree import Element
+
 import pytest
+from app.validators.mits.base import ValidationResult
 from app.validators.mits.offer_item_structure import OfferItemStructureValidator
 
 
-class TestItemHasInternalCode:
-    """Test item_has_internal_code rule."""
-
-    def test_item_with_internal_code(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem with InternalCode - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(internal_code="app_fee"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
-
-    def test_item_without_internal_code(self, parse_xml, create_charge_class):
-        """ChargeOfferItem without InternalCode - should fail."""
-        item = """<ChargeOfferItem>
-            <Name>Test</Name>
-            <Description>Test</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Application</Lifecycle>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-        assert any("item_has_internal_code" in e.rule_id for e in result.errors)
-
-    def test_item_with_empty_internal_code(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem with empty InternalCode - should fail."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(internal_code=""))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-        assert any("item_has_internal_code" in e.rule_id for e in result.errors)
-
-
-class TestItemInternalCodeUnique:
-    """Test item_internal_code_unique rule."""
-
-    def test_unique_internal_codes(self, parse_xml, create_charge_class, create_charge_item):
-        """All InternalCodes unique in class - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item("fee1") + create_charge_item("fee2"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
-
-    def test_duplicate_internal_codes(self, parse_xml, create_charge_class, create_charge_item):
-        """Duplicate InternalCodes in same class - should fail."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item("same_code") + create_charge_item("same_code"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-        assert any("item_internal_code_unique" in e.rule_id for e in result.errors)
-
-    def test_same_code_different_classes(self, parse_xml, create_charge_class, create_charge_item):
-        """Same InternalCode in different classes - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item("fee1"))}
-                {create_charge_class("SEC", create_charge_item("fee1"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        # Scope is per-class, so should pass
-
-
-class TestItemHasName:
-    """Test item_has_name rule."""
-
-    def test_item_with_name(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem with Name - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(name="Application Fee"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
-
-    def test_item_without_name(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem without Name - should fail."""
-        item = create_charge_item().replace("<Name>Test Item</Name>", "")
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-        assert any("item_has_name" in e.rule_id for e in result.errors)
-
-    def test_item_with_empty_name(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem with empty Name - should fail."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(name=""))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-
-
-class TestItemHasDescription:
-    """Test item_has_description rule."""
-
-    def test_item_with_description(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem with Description - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(description="One-time application fee"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
-
-    def test_item_without_description(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem without Description - should fail."""
-        item = create_charge_item().replace("<Description>Test Description</Description>", "")
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-        assert any("item_has_description" in e.rule_id for e in result.errors)
-
-
-class TestItemHasOneCharacteristics:
-    """Test item_has_one_characteristics rule."""
-
-    def test_item_with_characteristics(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem with exactly one Characteristics - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
-
-    def test_item_without_characteristics(self, parse_xml, create_charge_class):
-        """ChargeOfferItem without Characteristics - should fail."""
-        item = """<ChargeOfferItem InternalCode="fee1">
-            <Name>Test</Name>
-            <Description>Test</Description>
-            <AmountBasis>Explicit</AmountBasis>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-        assert any("item_has_one_characteristics" in e.rule_id for e in result.errors)
-
-
-class TestItemHasAmountBlocks:
-    """Test item_has_amount_blocks rule."""
-
-    def test_item_with_amount_block(self, parse_xml, create_charge_class, create_charge_item):
-        """ChargeOfferItem with ChargeOfferAmount - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item())}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
-
-    def test_item_without_amount_block_mandatory(self, parse_xml, create_charge_class):
-        """Mandatory item without ChargeOfferAmount - should fail."""
-        item = """<ChargeOfferItem InternalCode="fee1">
-            <Name>Test</Name>
-            <Description>Test</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Application</Lifecycle>
-            </Characteristics>
-            <AmountBasis>Explicit</AmountBasis>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-
-
-class TestItemAmountBasisRequired:
-    """Test item_amount_basis_required rule."""
-
-    def test_mandatory_item_with_amount_basis(self, parse_xml, create_charge_class, create_charge_item):
-        """Mandatory item with AmountBasis - should pass."""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", create_charge_item(requirement="Mandatory", amount_basis="Explicit"))}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is True
-
-    def test_mandatory_item_without_amount_basis(self, parse_xml, create_charge_class):
-        """Mandatory item without AmountBasis - should fail."""
-        item = """<ChargeOfferItem InternalCode="fee1">
-            <Name>Test</Name>
-            <Description>Test</Description>
-            <Characteristics>
-                <ChargeRequirement>Mandatory</ChargeRequirement>
-                <Lifecycle>At Application</Lifecycle>
-            </Characteristics>
-            <ChargeOfferAmount><Amounts>50</Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("APP", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        assert result.valid is False
-        assert any("item_amount_basis_required" in e.rule_id for e in result.errors)
-
-    def test_included_item_empty_amount_basis(self, parse_xml, create_charge_class):
-        """Included item with empty AmountBasis - should pass."""
-        item = """<ChargeOfferItem InternalCode="fee1">
-            <Name>Test</Name>
-            <Description>Test</Description>
-            <Characteristics>
-                <ChargeRequirement>Included</ChargeRequirement>
-                <Lifecycle>During Tenancy</Lifecycle>
-            </Characteristics>
-            <AmountBasis></AmountBasis>
-            <ChargeOfferAmount><Amounts></Amounts><Percentage></Percentage></ChargeOfferAmount>
-        </ChargeOfferItem>"""
-        xml = f"""<PhysicalProperty>
-            <Property IDValue="1">
-                {create_charge_class("UTIL", item)}
-            </Property>
-        </PhysicalProperty>"""
-        root = parse_xml(xml)
-        validator = OfferItemStructureValidator(root)
-        result = validator.validate()
-        
-        # Included items can have empty AmountBasis
+def _item(root: Element) -> Element:
+    """The first ChargeOfferItem of a baseline document copy."""
+    return root.find("Property/ChargeOfferClass/ChargeOfferItem")
+
+
+def _drop(tag: str) -> Callable[[Element], None]:
+    def _mutate(root: Element) -> None:
+        # ElementTree has no getparent(), so remove matches from each parent
+        for parent in list(root.iter()):
+            for child in parent.findall(tag):
+                parent.remove(child)
+    return _mutate
 
+
+def _set_text(path: str, text: str) -> Callable[[Element], None]:
+    def _mutate(root: Element) -> None:
+        _item(root).find(path).text = text
+    return _mutate
+
+
+def _set_code(code: str) -> Callable[[Element], None]:
+    def _mutate(root: Element) -> None:
+        _item(root).set("InternalCode", code)
+    return _mutate
+
+
+def _remove_code(root: Element) -> None:
+    del _item(root).attrib["InternalCode"]
+
+
+def _duplicate_item(new_code: Optional[str] = None) -> Callable[[Element], None]:
+    def _mutate(root: Element) -> None:
+        clone = copy.deepcopy(_item(root))
+        if new_code is not None:
+            clone.set("InternalCode", new_code)
+        root.find("Property/ChargeOfferClass").append(clone)
+    return _mutate
+
+
+def _duplicate_class(root: Element) -> None:
+    clone = copy.deepcopy(root.find("Property/ChargeOfferClass"))
+    clone.set("Code", "SEC")
+    root.find("Property").append(clone)
+
+
+def _included_without_amount_basis(root: Element) -> None:
+    item = _item(root)
+    item.find("Characteristics/ChargeRequirement").text = "Included"
+    item.find("AmountBasis").text = ""
+    item.find("ChargeOfferAmount/Amounts").text = ""
+
+
+class Case(NamedTuple):
+    mutation: Optional[Callable[[Element], None]]
+    rule_id: Optional[str]
+    valid: bool
+
+
+CASES = {
+    # item_has_internal_code
+    "baseline": Case(None, None, True),
+    "missing_internal_code": Case(_remove_code, "item_has_internal_code", False),
+    "empty_internal_code": Case(_set_code(""), "item_has_internal_code", False),
+    # item_internal_code_unique (scope is per class)
+    "unique_internal_codes": Case(_duplicate_item("item2"), None, True),
+    "duplicate_internal_codes": Case(_duplicate_item(), "item_internal_code_unique", False),
+    "same_code_different_classes": Case(_duplicate_class, None, True),
+    # item_has_name / item_has_description
+    "missing_name": Case(_drop("Name"), "item_has_name", False),
+    "empty_name": Case(_set_text("Name", ""), "item_has_name", False),
+    "missing_description": Case(_drop("Description"), "item_has_description", False),
+    "empty_description": Case(_set_text("Description", ""), "item_has_description", False),
+    # item_has_one_characteristics / item_has_amount_blocks
+    "missing_characteristics": Case(
+        _drop("Characteristics"), "item_has_one_characteristics", False
+    ),
+    "mandatory_missing_amount_block": Case(
+        _drop("ChargeOfferAmount"), "item_has_amount_blocks", False
+    ),
+    # item_amount_basis_required
+    "mandatory_missing_amount_basis": Case(
+        _drop("AmountBasis"), "item_amount_basis_required", False
+    ),
+    "included_empty_amount_basis": Case(_included_without_amount_basis, None, True),
+}
+
+
+@pytest.fixture(scope="session")
+def root_factory(minimal_valid_root):
+    """Build a mutated copy of the pre-parsed baseline document."""
+    def _build(mutation: Optional[Callable[[Element], None]]) -> Element:
+        if mutation is None:
+            return minimal_valid_root
+        root = copy.deepcopy(minimal_valid_root)
+        mutation(root)
+        return root
+    return _build
+
+
+@pytest.fixture(scope="module", params=list(CASES), ids=list(CASES))
+def case_result(request, root_factory) -> Tuple[Case, ValidationResult]:
+    """Validate each case once; every test below asserts on the same result."""
+    case = CASES[request.param]
+    return case, OfferItemStructureValidator(root_factory(case.mutation)).validate()
+
+
+def test_validity(case_result):
+    """Each mutation leaves the item valid or invalid as expected."""
+    case, result = case_result
+    assert result.valid is case.valid
+
+
+def test_rule_fired(case_result):
+    """Each mutation fires its rule, or no rule at all for valid cases."""
+    case, result = case_result
+    if case.rule_id is None:
+        assert result.errors == []
+    else:
+        assert case.rule_id in result.error_rule_ids